@@ -16,6 +16,7 @@
 """Config parsing functionality based on pydantic's BaseSettings"""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Dict, Final, Optional
 
@@ -25,6 +26,10 @@ from pydantic import BaseSettings
 # Default config prefix:
 DEFAULT_CONFIG_PREFIX: Final = "ghga_services"
 
+# Use the libyaml-based loader if PyYAML was built with it, it is considerably
+# faster than the pure-Python implementation:
+YAML_LOADER: Final = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ConfigYamlDoesNotExist(RuntimeError):
     """Thrown when the context manager is used out of context."""
@@ -95,7 +100,7 @@ def yaml_settings_factory(
             return {}
 
         with open(config_yaml, "r", encoding="utf8") as yaml_file:
-            return yaml.safe_load(yaml_file)
+            return yaml.load(yaml_file, Loader=YAML_LOADER)  # nosec
 
     return yaml_settings
 
@@ -143,24 +148,13 @@ def config_from_yaml(
                 "The specified settings class is not a subclass of pydantic.BaseSettings"
             )
 
-        def constructor_wrapper(
-            config_yaml: Optional[Path] = None,
-            **kwargs,
-        ):
-            """A wrapper for constructing a pydantic BaseSetting with modified sources
-
-            Args:
-                config_yaml (str, optional):
-                    Path to a config yaml. Overwrites the default location.
+        @lru_cache(maxsize=8)
+        def get_mod_settings(config_yaml: Optional[Path]) -> Any:
+            """Create the modified settings class for the specified config yaml.
+            The class is cached, since creating pydantic models is expensive and
+            the same settings are usually constructed repeatedly.
             """
 
-            # get default path if config_yaml not specified:
-            if config_yaml is None:
-                config_yaml = get_default_config_yaml(prefix)
-            else:
-                if not config_yaml.is_file():
-                    raise ConfigYamlDoesNotExist(path=config_yaml)
-
             class ModSettings(settings):
                 """Modifies the orginal Settings class provided by the user"""
 
@@ -186,8 +180,28 @@ def config_from_yaml(
                             yaml_settings_factory(config_yaml),
                         )
 
+            return ModSettings
+
+        def constructor_wrapper(
+            config_yaml: Optional[Path] = None,
+            **kwargs,
+        ):
+            """A wrapper for constructing a pydantic BaseSetting with modified sources
+
+            Args:
+                config_yaml (str, optional):
+                    Path to a config yaml. Overwrites the default location.
+            """
+
+            # get default path if config_yaml not specified:
+            if config_yaml is None:
+                config_yaml = get_default_config_yaml(prefix)
+            else:
+                if not config_yaml.is_file():
+                    raise ConfigYamlDoesNotExist(path=config_yaml)
+
             # construct settings class:
-            return ModSettings(**kwargs)
+            return get_mod_settings(config_yaml)(**kwargs)
 
         return constructor_wrapper
 
@@ -21,7 +21,7 @@ of that DAO.
 
 import re
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, List, Optional
 
 from .utils import DaoGenericBase
 
@@ -401,6 +401,21 @@ class ObjectStorageDao(DaoGenericBase):
         """
         raise NotImplementedError()
 
+    def do_objects_exist(
+        self, bucket_id: str, object_ids: List[str]
+    ) -> Dict[str, bool]:
+        """Check for multiple objects (`object_ids`) whether they exist in the bucket
+        with the specified id (`bucket_id`).
+        Returns a dictionary mapping each object ID to `True` if it exists and `False`
+        otherwise.
+        Implementations may override this method if the storage supports a more
+        efficient check than calling `does_object_exist` for every object.
+        """
+        return {
+            object_id: self.does_object_exist(bucket_id=bucket_id, object_id=object_id)
+            for object_id in object_ids
+        }
+
     def copy_object(
         self,
         source_bucket_id: str,
@@ -19,12 +19,18 @@ from the `object_storage_dao` module.
 """
 
 import hashlib
+import mmap
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 import requests
 from pydantic import BaseModel, validator
+from requests.adapters import HTTPAdapter
+from requests_toolbelt import MultipartEncoder
+from urllib3.util.retry import Retry
 
 from .object_storage_dao import (
     DEFAULT_PART_SIZE,
@@ -36,6 +42,21 @@ from .utils import TEST_FILE_PATHS
 
 MEBIBYTE = 1024 * 1024
 TIMEOUT = 30
+# the default number of file parts that are uploaded in parallel:
+DEFAULT_MAX_CONCURRENCY = 8
+
+# A shared session so that connections to the storage are kept alive and reused
+# across requests. The pool is large enough for the parallel part uploads.
+# Requests with idempotent methods (e.g. part uploads and downloads) are retried on
+# connection errors:
+SESSION = requests.Session()
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.1),
+)
+SESSION.mount("http://", _HTTP_ADAPTER)
+SESSION.mount("https://", _HTTP_ADAPTER)
 
 
 def calc_md5(content: bytes) -> str:
@@ -45,6 +66,25 @@ def calc_md5(content: bytes) -> str:
     return hashlib.md5(content).hexdigest()  # nosec
 
 
+def calc_file_md5(file_path: Path, chunk_size: int = MEBIBYTE) -> str:
+    """
+    Calc the md5 checksum for the file at the specified path. The file is memory
+    mapped and hashed in chunks of the specified size (`chunk_size`) so that it is
+    neither loaded into memory at once nor copied into intermediate buffers.
+    """
+    md5 = hashlib.md5()  # nosec
+    with open(file_path, "rb") as file:
+        # empty files cannot be mapped:
+        if os.fstat(file.fileno()).st_size == 0:
+            return md5.hexdigest()
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            with memoryview(mapped_file) as view:
+                for offset in range(0, len(view), chunk_size):
+                    md5.update(view[offset : offset + chunk_size])
+    return md5.hexdigest()
+
+
 class ObjectFixture(BaseModel):
     """A Model for describing fixtures for the object storage."""
 
@@ -58,25 +98,46 @@ class ObjectFixture(BaseModel):
     @validator("content", always=True)
     def read_content(cls, _, values):
         """Read in the file content."""
-        with open(values["file_path"], "rb") as file:
-            return file.read()
+        return _read_file_with_md5(values["file_path"])[0]
 
     # pylint: disable=no-self-argument
     @validator("md5", always=True)
     def calc_md5_from_content(cls, _, values):
         """Calculate md5 based on the content."""
-        return calc_md5(values["content"])
+        return _read_file_with_md5(values["file_path"])[1]
+
+
+def _read_file_with_md5(file_path: Path) -> Tuple[bytes, str]:
+    """Returns the content and the md5 checksum of the specified file. Both are
+    cached as the same test files are used by many fixtures."""
+    stat = os.stat(file_path)
+    return _read_file_with_md5_cached(Path(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=32)
+def _read_file_with_md5_cached(
+    file_path: Path, mtime_ns: int, size: int  # pylint: disable=unused-argument
+) -> Tuple[bytes, str]:
+    """Reads the file and calculates its md5 checksum. The modification time
+    (`mtime_ns`) and the `size` of the file are only part of the cache key so that
+    modified files are read again."""
+    with open(file_path, "rb") as file:
+        content = file.read()
+    return content, calc_md5(content)
 
 
 def upload_file(presigned_url: PresignedPostURL, file_path: Path, file_md5: str):
     """Uploads the test file to the specified URL"""
     with open(file_path, "rb") as test_file:
-        files = {"file": (str(file_path), test_file)}
-        headers = {"ContentMD5": file_md5}
-        response = requests.post(
+        # The multipart body is streamed from the file instead of being assembled
+        # in memory. The file has to be the last field of a presigned POST:
+        encoder = MultipartEncoder(
+            fields={**presigned_url.fields, "file": (str(file_path), test_file)}
+        )
+        headers = {"ContentMD5": file_md5, "Content-Type": encoder.content_type}
+        response = SESSION.post(
             presigned_url.url,
-            data=presigned_url.fields,
-            files=files,
+            data=encoder,
             headers=headers,
             timeout=TIMEOUT,
         )
@@ -113,7 +174,7 @@ def upload_part(
         object_id=object_id,
         part_number=part_number,
     )
-    response = requests.put(upload_url, data=content, timeout=TIMEOUT)
+    response = SESSION.put(upload_url, data=content, timeout=TIMEOUT)
     response.raise_for_status()
 
 
@@ -141,40 +202,77 @@ def upload_part_of_size(
     )
 
 
+# pylint: disable=too-many-arguments
+def upload_file_part(
+    storage_dao: ObjectStorageDao,
+    upload_id: str,
+    bucket_id: str,
+    object_id: str,
+    file_path: Path,
+    part_size: int,
+    part_number: int,
+):
+    """Read the part with the specified number from the file and upload it to an
+    initialized multipart upload. Only the content of this part is loaded into
+    memory."""
+
+    print(f" - read part number {part_number} from file: {str(file_path)}")
+    with open(file_path, "rb") as test_file:
+        test_file.seek((part_number - 1) * part_size)
+        file_part = test_file.read(part_size)
+
+    print(f" - upload part number {part_number} using upload url")
+    upload_part(
+        storage_dao=storage_dao,
+        upload_id=upload_id,
+        bucket_id=bucket_id,
+        object_id=object_id,
+        content=file_part,
+        part_number=part_number,
+    )
+
+
+# pylint: disable=too-many-arguments
 def multipart_upload_file(
     storage_dao: ObjectStorageDao,
     bucket_id: str,
     object_id: str,
     file_path: Path,
     part_size: int = DEFAULT_PART_SIZE,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
 ) -> None:
-    """Uploads the test file to the specified URL"""
+    """Uploads the test file to the specified URL. Up to `max_concurrency` file parts
+    are read and uploaded in parallel, so that at most `max_concurrency` parts are
+    kept in memory at the same time."""
 
     check_part_size(file_path=file_path, anticipated_size=part_size)
+    part_count = -(-os.path.getsize(file_path) // part_size)
 
     print(f" - initiate multipart upload for test object {object_id}")
     upload_id = storage_dao.init_multipart_upload(
         bucket_id=bucket_id, object_id=object_id
     )
 
-    with open(file_path, "rb") as test_file:
-        for part_number in range(1, MAX_FILE_PART_NUMBER + 1):
-            print(f" - read {part_size} from file: {str(file_path)}")
-            file_part = test_file.read(part_size)
-
-            if not file_part:
-                print(f" - everything uploaded with {part_number} parts")
-                break
-
-            print(f" - upload part number {part_number} using upload url")
-            upload_part(
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        part_uploads = [
+            executor.submit(
+                upload_file_part,
                 storage_dao=storage_dao,
                 upload_id=upload_id,
                 bucket_id=bucket_id,
                 object_id=object_id,
-                content=file_part,
+                file_path=file_path,
+                part_size=part_size,
                 part_number=part_number,
             )
+            for part_number in range(1, part_count + 1)
+        ]
+
+        # wait for all parts and propagate errors:
+        for part_upload in part_uploads:
+            part_upload.result()
+
+    print(f" - everything uploaded with {part_count} parts")
 
     print(" - complete multipart upload")
     storage_dao.complete_multipart_upload(
@@ -187,10 +285,14 @@ def multipart_upload_file(
 def download_and_check_test_file(presigned_url: str, expected_md5: str):
     """Downloads the test file from thespecified URL and checks its integrity (md5)."""
 
-    response = requests.get(presigned_url, timeout=TIMEOUT)
-    response.raise_for_status()
+    # the response body is hashed while being streamed instead of being buffered:
+    md5 = hashlib.md5()  # nosec
+    with SESSION.get(presigned_url, timeout=TIMEOUT, stream=True) as response:
+        response.raise_for_status()
+        for chunk in response.iter_content(chunk_size=MEBIBYTE):
+            md5.update(chunk)
 
-    observed_md5 = calc_md5(response.content)
+    observed_md5 = md5.hexdigest()
 
     assert (  # nosec
         observed_md5 == expected_md5
@@ -235,9 +337,26 @@ def populate_storage(
     for bucket_fixture in bucket_fixtures:
         storage.create_bucket(bucket_fixture)
 
-    for object_fixture in object_fixtures:
-        if not storage.does_bucket_exist(object_fixture.bucket_id):
-            storage.create_bucket(object_fixture.bucket_id)
+    # check the existence of every additional bucket only once:
+    object_bucket_ids = {
+        object_fixture.bucket_id for object_fixture in object_fixtures
+    } - set(bucket_fixtures)
+    for bucket_id in object_bucket_ids:
+        if not storage.does_bucket_exist(bucket_id):
+            storage.create_bucket(bucket_id)
+
+    def upload_object_fixture(object_fixture: ObjectFixture) -> None:
+        """Upload the file of a single object fixture."""
+        # Files larger than a single part are uploaded in parallel parts, smaller
+        # ones are not worth the overhead of a multipart upload:
+        if os.path.getsize(object_fixture.file_path) > DEFAULT_PART_SIZE:
+            multipart_upload_file(
+                storage_dao=storage,
+                bucket_id=object_fixture.bucket_id,
+                object_id=object_fixture.object_id,
+                file_path=object_fixture.file_path,
+            )
+            return
 
         presigned_url = storage.get_object_upload_url(
             bucket_id=object_fixture.bucket_id, object_id=object_fixture.object_id
@@ -248,3 +367,8 @@ def populate_storage(
             file_path=object_fixture.file_path,
             file_md5=object_fixture.md5,
         )
+
+    # the presigned URLs are generated locally, the uploads are run in parallel:
+    with ThreadPoolExecutor(max_workers=DEFAULT_MAX_CONCURRENCY) as executor:
+        # consume the results to re-raise exceptions:
+        list(executor.map(upload_object_fixture, object_fixtures))
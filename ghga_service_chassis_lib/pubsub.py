@@ -200,7 +200,12 @@ class AmqpTopic:
 
         return connection, channel
 
-    def subscribe(self, exec_on_message: Callable, run_forever: bool = True):
+    def subscribe(
+        self,
+        exec_on_message: Callable,
+        run_forever: bool = True,
+        timeout_after: Optional[float] = None,
+    ):
         """Subscribe to a topic and execute the specified function whenever
         a message is received.
 
@@ -213,28 +218,52 @@ class AmqpTopic:
                 If `True`, the function will continue to consume messages for ever.
                 If `False`, the function will wait for the first message, cosume it,
                 and exit. Defaults to `True`.
+            timeout_after (Optional[float]):
+                Optional. If provided, the consumption is stopped after this many
+                seconds and a TimeoutError is thrown unless it has stopped before
+                (i.e. after consuming the first message if `run_forever` is `False`).
         """
 
-        _, channel = self.init_subscriber_queue()
-
-        # consume from the channel:
-        channel.basic_qos(prefetch_count=1)
-        channel.basic_consume(
-            queue=self.sub_queue_name,
-            on_message_callback=callback_factory(
-                exec_on_message=exec_on_message,
-                json_schema=self.json_schema,
-                stop_on_consume=not run_forever,
-            ),
-        )
+        connection, channel = self.init_subscriber_queue()
+        timed_out = False
 
-        logging.info(
-            ' [*] %s: Waiting for messages in topic "%s".',
-            datetime.now(timezone.utc).isoformat(),
-            self.topic_name,
-        )
+        def stop_on_timeout():
+            """Stops consuming once the timeout is reached."""
+            nonlocal timed_out
+            timed_out = True
+            channel.stop_consuming()
 
-        channel.start_consuming()
+        try:
+            # consume from the channel:
+            channel.basic_qos(prefetch_count=1)
+            channel.basic_consume(
+                queue=self.sub_queue_name,
+                on_message_callback=callback_factory(
+                    exec_on_message=exec_on_message,
+                    json_schema=self.json_schema,
+                    stop_on_consume=not run_forever,
+                ),
+            )
+
+            logging.info(
+                ' [*] %s: Waiting for messages in topic "%s".',
+                datetime.now(timezone.utc).isoformat(),
+                self.topic_name,
+            )
+
+            # the timer is run by the connection, so that the consumption is stopped
+            # in this thread instead of being left running in the background:
+            if timeout_after is not None:
+                connection.call_later(timeout_after, stop_on_timeout)
+
+            channel.start_consuming()
+        finally:
+            # the connection is not reused once the consumption has stopped:
+            if connection.is_open:
+                connection.close()
+
+        if timed_out:
+            raise TimeoutError()
 
     def publish(self, message: dict):
         """Publish a message to the topic
@@ -34,8 +34,6 @@ import pika
 import pytest
 from testcontainers.core.container import DockerContainer
 
-from ghga_service_chassis_lib.utils import exec_with_timeout
-
 from .pubsub import AmqpTopic, PubSubConfigBase
 
 
@@ -140,10 +138,12 @@ class RabbitMqContainer(DockerContainer):
         timeout_deadline = datetime.now(timezone.utc) + timedelta(
             seconds=self.startup_timeout
         )
+        # the broker is probed right away, the delay is only applied between failed
+        # probes:
         while datetime.now(timezone.utc) < timeout_deadline:
-            sleep(self._READINESS_RETRY_DELAY)
             if self.readiness_probe():
                 return self
+            sleep(self._READINESS_RETRY_DELAY)
 
         raise ReadinessTimeoutError(
             "The RabbitMQ broker failed to start within the expected time frame."
@@ -190,7 +190,9 @@ class TestPubSubClient:
                 topic_name=self.topic_name,
             )
 
-        subscriber_topic.init_subscriber_queue()
+        # only the queue is needed, the connection is not kept open:
+        connection, _ = subscriber_topic.init_subscriber_queue()
+        connection.close()
 
 
 class TestPublisher(TestPubSubClient):
@@ -259,14 +261,11 @@ class TestSubscriber(TestPubSubClient):
 
             update_with_message.update(message)
 
-        exec_with_timeout(
-            func=self.topic.subscribe,
-            func_kwargs={
-                "exec_on_message": lambda message: process_message(
-                    message, message_to_return
-                ),
-                "run_forever": False,
-            },
+        # the subscription stops itself on timeout, so that no consumer is left
+        # behind that could take the messages of later tests:
+        self.topic.subscribe(
+            exec_on_message=lambda message: process_message(message, message_to_return),
+            run_forever=False,
             timeout_after=timeout_after,
         )
 
@@ -333,22 +332,41 @@ class AmqpFixture:
         )
 
 
+# the RabbitMQ container shared across the test session is stored in the pytest
+# config, so that the `amqp_fixture` does not depend on any other fixture:
+_RABBITMQ_CONTAINER_KEY = pytest.StashKey[RabbitMqContainer]()
+
+
+def _get_rabbitmq_container(request: pytest.FixtureRequest) -> RabbitMqContainer:
+    """Returns the RabbitMQ container shared across the test session. It is started
+    on first use and stopped at the end of the session."""
+    if _RABBITMQ_CONTAINER_KEY not in request.config.stash:
+        container = RabbitMqContainer()
+        container.start()
+        request.config.stash[_RABBITMQ_CONTAINER_KEY] = container
+        request.config.add_cleanup(container.stop)
+
+    return request.config.stash[_RABBITMQ_CONTAINER_KEY]
+
+
 def amqp_fixture_factory(service_name: str = "my_service"):
     """A factory for creating Pytest fixture for working with AMQP."""
 
     @pytest.fixture
-    def amqp_fixture() -> Generator[AmqpFixture, None, None]:
-        """Pytest fixture for working with AMQP."""
+    def amqp_fixture(
+        request: pytest.FixtureRequest,
+    ) -> Generator[AmqpFixture, None, None]:
+        """Pytest fixture for working with AMQP. The RabbitMQ container is shared
+        across the test session."""
 
-        with RabbitMqContainer() as rabbitmq:
-            connection_params = rabbitmq.get_connection_params()
+        connection_params = _get_rabbitmq_container(request).get_connection_params()
 
-            config = PubSubConfigBase(
-                rabbitmq_host=connection_params.host,
-                rabbitmq_port=connection_params.port,
-                service_name=service_name,
-            )
+        config = PubSubConfigBase(
+            rabbitmq_host=connection_params.host,
+            rabbitmq_port=connection_params.port,
+            service_name=service_name,
+        )
 
-            yield AmqpFixture(config=config)
+        yield AmqpFixture(config=config)
 
     return amqp_fixture
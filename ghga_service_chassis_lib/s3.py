@@ -17,9 +17,21 @@
 This modules contains logic for interacting with S3-compatible object storage.
 """
 
+import base64
+import hashlib
+import hmac
+import json
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from datetime import datetime, timedelta, timezone
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, TypeVar
+from urllib.parse import SplitResult, quote, urlsplit
 
 import boto3
 import botocore.client
@@ -48,6 +60,45 @@ from .object_storage_dao import (
 )
 from .utils import OutOfContextError
 
+T = TypeVar("T")
+
+# the maximum number of keys returned by a single ListObjectsV2 request
+# (and accepted by a single DeleteObjects request):
+LIST_OBJECTS_PAGE_SIZE = 1000
+# the maximum number of DeleteObjects requests that are in flight at the same time:
+DELETE_OBJECTS_MAX_WORKERS = 8
+
+# error codes returned by S3 if a bucket or object could not be found:
+NOT_FOUND_ERROR_CODES = ("404", "NoSuchBucket", "NotFound")
+# error codes returned by S3 if a bucket or object is not accessible with the used
+# credentials:
+ACCESS_DENIED_ERROR_CODES = ("403", "AccessDenied", "Forbidden")
+
+# presigned URLs are reused for at most this many seconds and for at most 1 % of their
+# expiry duration, so that a cached URL is valid for at least 99 % of the requested
+# duration (URLs expiring after less than 100 seconds are not cached at all):
+PRESIGNED_URL_CACHE_MAX_AGE = 60
+PRESIGNED_URL_CACHE_SIZE = 1024
+# the expiry duration of presigned URLs for uploading parts (botocore's default):
+PART_UPLOAD_URL_EXPIRY = 3600
+
+# if enabled, the existence of objects is remembered for this many seconds, only
+# positive results are cached as objects may be uploaded using presigned URLs at any
+# time:
+OBJECT_EXISTENCE_CACHE_TTL = 2
+OBJECT_EXISTENCE_CACHE_SIZE = 1024
+
+# default client config, retries transient errors and throttling responses using
+# exponential backoff with jitter and keeps enough connections alive for the parallel
+# requests sent by this module (settings from an `aws_config_ini` take precedence):
+DEFAULT_BOTO_CONFIG = botocore.config.Config(
+    retries={"max_attempts": 5, "mode": "adaptive"},
+    connect_timeout=3,
+    read_timeout=30,
+    max_pool_connections=32,
+    tcp_keepalive=True,
+)
+
 
 class S3ConfigBase(BaseSettings):
     """A base class with S3-specific config params.
@@ -111,68 +162,628 @@ class S3ConfigBase(BaseSettings):
     )
 
 
-@lru_cache
+@lru_cache(maxsize=8)
 def read_aws_config_ini(aws_config_ini: Path) -> botocore.config.Config:
     """
     Reads an aws config ini (see:
     https://boto3.amazonaws.com/v1/documentation/api/latest/guide/configuration.html#using-a-configuration-file)
     and returns an botocore.config.Config object.
+    The result is cached per path and shared between callers, so it must not be
+    modified (use `merge` to derive a new config instead).
     """
 
     config_profile = botocore.configloader.load_config(config_filename=aws_config_ini)
     return botocore.config.Config(**config_profile)
 
 
+@lru_cache(maxsize=8)
+def _get_boto_config(aws_config_ini: Optional[Path]) -> botocore.config.Config:
+    """Returns the default boto config merged with the config read from the
+    specified aws config ini (if any)."""
+    if aws_config_ini is None:
+        return DEFAULT_BOTO_CONFIG
+    return DEFAULT_BOTO_CONFIG.merge(read_aws_config_ini(aws_config_ini))
+
+
+def _create_s3_client(config: S3ConfigBase) -> botocore.client.BaseClient:
+    """Creates a new S3 client for the storage specified in the `config`."""
+    session = boto3.session.Session(
+        aws_access_key_id=config.s3_access_key_id,
+        aws_secret_access_key=config.s3_secret_access_key,
+        aws_session_token=config.s3_session_token,
+    )
+
+    return session.client(
+        service_name="s3",
+        endpoint_url=config.s3_endpoint_url,
+        config=_get_boto_config(config.aws_config_ini),
+    )
+
+
+@lru_cache
+def _get_upload_conditions(max_upload_size: Optional[int]) -> list:
+    """
+    Returns the conditions for a presigned POST URL that limit the upload size to the
+    specified number of bytes (`max_upload_size`). If `None`, no conditions are
+    applied.
+    The list is shared between calls (botocore copies it before adding its own
+    conditions), so it must not be modified by callers.
+    """
+    return (
+        []
+        if max_upload_size is None
+        else [
+            # set upload size limit:
+            ["content-length-range", 0, max_upload_size],
+        ]
+    )
+
+
+class _LRUCache:
+    """A minimal cache that discards the least recently used entry once more than
+    `maxsize` entries are stored. If a `ttl` (in seconds) is specified, entries that
+    are older are ignored. The cache may be used from multiple threads.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable, max_age: Optional[float] = None) -> Optional[Any]:
+        """Returns the value stored for the `key` or `None` if there is none. If a
+        `max_age` (in seconds) is specified, older entries are ignored as well."""
+        with self._lock:
+            if key not in self._entries:
+                return None
+
+            stored_at, value = self._entries[key]
+            age = time.monotonic() - stored_at
+            if self._ttl is not None and age > self._ttl:
+                del self._entries[key]
+                return None
+            if max_age is not None and age > max_age:
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any, stored_at: Optional[float] = None) -> None:
+        """Stores the `value` for the `key`. The age of the entry is measured from
+        `stored_at` (a `time.monotonic()` timestamp), which defaults to now."""
+        if stored_at is None:
+            stored_at = time.monotonic()
+        with self._lock:
+            self._entries[key] = (stored_at, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        """Removes the entry for the `key` if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Removes all entries with a key matching the `predicate`."""
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+
+def _get_presigned_url_max_age(expires_after: int) -> int:
+    """Returns for how many seconds a URL that was presigned to expire after the
+    specified number of seconds (`expires_after`) may be reused. Zero means that the
+    URL must not be cached."""
+    return min(PRESIGNED_URL_CACHE_MAX_AGE, expires_after // 100)
+
+
+# pylint: disable=too-many-arguments
+def _presign_get_request(
+    host: str,
+    canonical_uri: str,
+    region: str,
+    access_key_id: str,
+    secret_access_key: str,
+    expires_after: int,
+    timestamp: datetime,
+) -> str:
+    """
+    Computes the query string of a presigned GET request for the specified `host` and
+    URL-encoded path (`canonical_uri`) using AWS Signature Version 4 (see:
+    https://docs.aws.amazon.com/AmazonS3/latest/API/sigv4-query-string-auth.html).
+    This is equivalent to boto3's `generate_presigned_url` for the "get_object"
+    operation but does not go through the generic request machinery of botocore.
+    """
+    amz_date = timestamp.strftime("%Y%m%dT%H%M%SZ")
+    date_stamp = amz_date[:8]
+    scope = f"{date_stamp}/{region}/s3/aws4_request"
+
+    query_params = {
+        "X-Amz-Algorithm": "AWS4-HMAC-SHA256",
+        "X-Amz-Credential": f"{access_key_id}/{scope}",
+        "X-Amz-Date": amz_date,
+        "X-Amz-Expires": str(expires_after),
+        "X-Amz-SignedHeaders": "host",
+    }
+    canonical_query = "&".join(
+        f"{quote(name, safe='-_.~')}={quote(value, safe='-_.~')}"
+        for name, value in sorted(query_params.items())
+    )
+    canonical_request = "\n".join(
+        [
+            "GET",
+            canonical_uri,
+            canonical_query,
+            # canonical headers (terminated by an empty line) and signed headers:
+            f"host:{host}",
+            "",
+            "host",
+            "UNSIGNED-PAYLOAD",
+        ]
+    )
+    string_to_sign = "\n".join(
+        [
+            "AWS4-HMAC-SHA256",
+            amz_date,
+            scope,
+            hashlib.sha256(canonical_request.encode()).hexdigest(),
+        ]
+    )
+
+    signing_key = _get_signing_key(
+        secret_access_key=secret_access_key, date_stamp=date_stamp, region=region
+    )
+    signature = hmac.new(
+        signing_key, string_to_sign.encode(), hashlib.sha256
+    ).hexdigest()
+
+    return f"{canonical_query}&X-Amz-Signature={signature}"
+
+
+# pylint: disable=too-many-arguments
+def _presign_post_request(
+    bucket_id: str,
+    object_id: str,
+    conditions: list,
+    region: str,
+    access_key_id: str,
+    secret_access_key: str,
+    expires_after: int,
+    timestamp: datetime,
+) -> Dict[str, str]:
+    """
+    Computes the form fields of a presigned POST request for uploading an object with
+    the specified ID (`object_id`) to the bucket with the specified ID (`bucket_id`)
+    using AWS Signature Version 4 (see:
+    https://docs.aws.amazon.com/AmazonS3/latest/API/sigv4-HTTPPOSTConstructPolicy.html).
+    This is equivalent to the fields returned by boto3's `generate_presigned_post` but
+    does not go through the generic request machinery of botocore.
+    """
+    amz_date = timestamp.strftime("%Y%m%dT%H%M%SZ")
+    date_stamp = amz_date[:8]
+    credential = f"{access_key_id}/{date_stamp}/{region}/s3/aws4_request"
+    expiration = timestamp + timedelta(seconds=expires_after)
+
+    fields = {
+        "key": object_id,
+        "x-amz-algorithm": "AWS4-HMAC-SHA256",
+        "x-amz-credential": credential,
+        "x-amz-date": amz_date,
+    }
+    policy = {
+        "expiration": expiration.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "conditions": [
+            *conditions,
+            {"bucket": bucket_id},
+            *({name: value} for name, value in fields.items()),
+        ],
+    }
+    encoded_policy = base64.b64encode(json.dumps(policy).encode()).decode()
+
+    signing_key = _get_signing_key(
+        secret_access_key=secret_access_key, date_stamp=date_stamp, region=region
+    )
+    signature = hmac.new(
+        signing_key, encoded_policy.encode(), hashlib.sha256
+    ).hexdigest()
+
+    return {**fields, "policy": encoded_policy, "x-amz-signature": signature}
+
+
+def _get_signing_key(secret_access_key: str, date_stamp: str, region: str) -> bytes:
+    """Derives the AWS Signature Version 4 signing key for the S3 service from the
+    secret access key, the date (`date_stamp` in the format "YYYYMMDD"), and the
+    region."""
+    signing_key = f"AWS4{secret_access_key}".encode()
+    for scope_part in (date_stamp, region, "s3", "aws4_request"):
+        signing_key = hmac.new(
+            signing_key, scope_part.encode(), hashlib.sha256
+        ).digest()
+
+    return signing_key
+
+
+def _get_host(endpoint: SplitResult) -> str:
+    """Returns the host (including the port if not the default one of the scheme) of
+    the specified endpoint URL as used in the host header."""
+    default_port = {"http": 80, "https": 443}.get(endpoint.scheme)
+    host = endpoint.hostname or ""
+    if endpoint.port not in (None, default_port):
+        host = f"{host}:{endpoint.port}"
+
+    return host
+
+
 def _format_s3_error_code(error_code: str):
     """Formats a message to describe and s3 error code."""
     return f"S3 error with code: '{error_code}'"
 
 
-def _translate_s3_client_errors(
-    source_exception: botocore.exceptions.ClientError,
-    upload_id: Optional[str] = None,
-    bucket_id: Optional[str] = None,
-    object_id: Optional[str] = None,
-) -> Exception:
+def _upload_not_found_error(
+    upload_id: Optional[str], bucket_id: Optional[str], object_id: Optional[str]
+) -> MultiPartUploadNotFoundError:
+    """Creates a MultiPartUploadNotFoundError, which requires all IDs to be known."""
+    if upload_id is None or bucket_id is None or object_id is None:
+        raise ValueError()
+    return MultiPartUploadNotFoundError(
+        upload_id=upload_id, bucket_id=bucket_id, object_id=object_id
+    )
+
+
+# maps S3 error codes to functions that create the corresponding exception given the
+# upload, bucket, and object ID:
+EXACT_ERROR_CODE_TRANSLATIONS: Dict[
+    str,
+    Callable[[Optional[str], Optional[str], Optional[str]], ObjectStorageDaoError],
+] = {
+    "NoSuchBucket": lambda _, bucket_id, __: BucketNotFoundError(bucket_id=bucket_id),
+    "BucketAlreadyExists": lambda _, bucket_id, __: BucketAlreadyExists(
+        bucket_id=bucket_id
+    ),
+    "NoSuchKey": lambda _, bucket_id, object_id: ObjectNotFoundError(
+        bucket_id=bucket_id, object_id=object_id
+    ),
+    "ObjectAlreadyInActiveTierError": lambda _, bucket_id, object_id: (
+        ObjectAlreadyExistsError(bucket_id=bucket_id, object_id=object_id)
+    ),
+    "NoSuchUpload": _upload_not_found_error,
+}
+BUCKET_ERROR_KEYWORDS = ("Bucket",)
+OBJECT_ERROR_KEYWORDS = ("Object", "Key")
+
+
+class _ObjectStorageS3Base:
     """
-    Translates S3 client errors based on their error codes into exceptions from the
-    .object_storage_dao modules
+    Logic shared by the synchronous `ObjectStorageS3` and the asynchronous
+    `s3_async.AsyncObjectStorageS3` that does not depend on how requests are sent,
+    i.e. handling the config, validating part numbers, checking multipart uploads,
+    translating client errors, and signing as well as caching presigned URLs.
+    Subclasses set the `_client` when entering their context.
     """
-    error_code = source_exception.response["Error"]["Code"]
-
-    exception: ObjectStorageDaoError
-
-    # try to exactly match the error code:
-    if error_code == "NoSuchBucket":
-        exception = BucketNotFoundError(bucket_id=bucket_id)
-    elif error_code == "BucketAlreadyExists":
-        exception = BucketAlreadyExists(bucket_id=bucket_id)
-    elif error_code == "NoSuchKey":
-        exception = ObjectNotFoundError(bucket_id=bucket_id, object_id=object_id)
-    elif error_code == "ObjectAlreadyInActiveTierError":
-        exception = ObjectAlreadyExistsError(bucket_id=bucket_id, object_id=object_id)
-    elif error_code == "ObjectAlreadyInActiveTierError":
-        exception = ObjectAlreadyExistsError(bucket_id=bucket_id, object_id=object_id)
-    elif error_code == "NoSuchUpload":
-        if upload_id is None or bucket_id is None or object_id is None:
-            raise ValueError()
-        exception = MultiPartUploadNotFoundError(
-            upload_id=upload_id, bucket_id=bucket_id, object_id=object_id
+
+    def __init__(self, config: S3ConfigBase):
+        """Initialize with parameters needed to connect to the S3 storage.
+
+        Args:
+            config (S3ConfigBase): Config parameters specified using the S3ConfigBase model.
+        """
+        # initializes the DAO base class that follows in the MRO of the subclass:
+        super().__init__(config)  # type: ignore[call-arg]
+        self._config = config
+
+        self.endpoint_url = config.s3_endpoint_url
+
+        self._advanced_config = _get_boto_config(config.aws_config_ini)
+
+        # Presigned URLs are generated without botocore if only static credentials
+        # and path-style addressing with signature version 4 are used:
+        s3_options = self._advanced_config.s3 or {}
+        self._sign_urls_locally = (
+            config.s3_session_token is None
+            and s3_options.get("addressing_style") in (None, "auto", "path")
+            and self._advanced_config.signature_version in (None, "s3v4")
+        )
+
+        # will be set when entering the context:
+        self._client: Optional[botocore.client.BaseClient] = None
+        self._presigned_url_cache = _LRUCache(maxsize=PRESIGNED_URL_CACHE_SIZE)
+
+    def _clear_presigned_url_cache(self) -> None:
+        """Discards all cached presigned URLs. Presigned URLs are only reused as long
+        as they were signed by the same client, thus, this is called whenever a new
+        client is set."""
+        self._presigned_url_cache = _LRUCache(maxsize=PRESIGNED_URL_CACHE_SIZE)
+
+    def _get_cached_url(self, cache_key: Hashable, expires_after: int) -> Optional[Any]:
+        """Returns the presigned URL cached for the `cache_key` if it is still valid
+        for almost the entire requested duration (`expires_after` in seconds, see
+        `_get_presigned_url_max_age`) or None otherwise."""
+        return self._presigned_url_cache.get(
+            cache_key, max_age=_get_presigned_url_max_age(expires_after)
         )
-    else:
+
+    def _cache_url(
+        self,
+        cache_key: Hashable,
+        expires_after: int,
+        presigned_url: Any,
+        signed_at: float,
+    ) -> None:
+        """Caches a presigned URL that was signed at `signed_at` (as returned by
+        `time.monotonic`) unless its expiry duration (`expires_after` in seconds) is
+        too short to reuse it."""
+        if _get_presigned_url_max_age(expires_after) > 0:
+            self._presigned_url_cache.put(cache_key, presigned_url, stored_at=signed_at)
+
+    @staticmethod
+    def _is_not_found_error(error: botocore.exceptions.ClientError) -> bool:
+        """Checks whether a client error reports that a bucket or object was not
+        found."""
+        return error.response["Error"]["Code"] in NOT_FOUND_ERROR_CODES
+
+    @staticmethod
+    def _is_access_denied_error(error: botocore.exceptions.ClientError) -> bool:
+        """Checks whether a client error reports that access to a bucket or object
+        was denied."""
+        return error.response["Error"]["Code"] in ACCESS_DENIED_ERROR_CODES
+
+    @staticmethod
+    def _translate_client_error(
+        source_exception: botocore.exceptions.ClientError,
+        upload_id: Optional[str] = None,
+        bucket_id: Optional[str] = None,
+        object_id: Optional[str] = None,
+    ) -> Exception:
+        """
+        Translates S3 client errors based on their error codes into exceptions from the
+        .object_storage_dao modules
+        """
+        error_code = source_exception.response["Error"]["Code"]
+
+        # try to exactly match the error code:
+        translation = EXACT_ERROR_CODE_TRANSLATIONS.get(error_code)
+        if translation is not None:
+            return translation(upload_id, bucket_id, object_id)
+
         # exact match not found, match by keyword:
-        if "Bucket" in error_code:
-            exception = BucketError(_format_s3_error_code(error_code))
-        elif "Object" in error_code or "Key" in error_code:
-            exception = ObjectError(_format_s3_error_code(error_code))
-        else:
-            # if nothing matches, return a generic error:
-            exception = ObjectStorageDaoError(_format_s3_error_code(error_code))
+        if any(keyword in error_code for keyword in BUCKET_ERROR_KEYWORDS):
+            return BucketError(_format_s3_error_code(error_code))
+        if any(keyword in error_code for keyword in OBJECT_ERROR_KEYWORDS):
+            return ObjectError(_format_s3_error_code(error_code))
+
+        # if nothing matches, return a generic error:
+        return ObjectStorageDaoError(_format_s3_error_code(error_code))
+
+    @staticmethod
+    def _validate_part_number(part_number: int) -> None:
+        """Raises a ValueError if the part number is not accepted by S3."""
+        if not 0 < part_number <= 10000:
+            raise ValueError(
+                "The part number must be a non-zero positive integer"
+                + " smaller or equal to 10000"
+            )
+
+    @staticmethod
+    def _get_upload_ids(uploads_info: dict, object_id: str) -> List[str]:
+        """Returns the IDs of the multi-part uploads for the object with the specified
+        ID (`object_id`) that are listed in the response of a ListMultipartUploads
+        request (`uploads_info`)."""
+        return [
+            upload["UploadId"]
+            for upload in uploads_info.get("Uploads", [])
+            if upload["Key"] == object_id
+        ]
+
+    @staticmethod
+    def _check_upload_ids(
+        upload_ids: List[str],
+        upload_id: str,
+        bucket_id: str,
+        object_id: str,
+        assert_exclusiveness: bool = True,
+    ) -> None:
+        """Checks if a multipart upload with the given ID (`upload_id`) is among the
+        active uploads of the specified object (`upload_ids`). Otherwise, raises a
+        MultiPartUploadNotFoundError.
+
+        By default, it is also verified that this upload is the only upload active for
+        that object. Otherwise, raises a MultipleActiveUploadsError.
+        """
+        if assert_exclusiveness and len(upload_ids) > 1:
+            raise MultipleActiveUploadsError(
+                bucket_id=bucket_id, object_id=object_id, upload_ids=upload_ids
+            )
+
+        if upload_id not in upload_ids:
+            raise MultiPartUploadNotFoundError(
+                upload_id=upload_id,
+                bucket_id=bucket_id,
+                object_id=object_id,
+            )
+
+    # pylint: disable=too-many-arguments
+    @staticmethod
+    def _check_uploaded_parts(
+        upload_id: str,
+        bucket_id: str,
+        object_id: str,
+        parts_info: dict,
+        anticipated_part_quantity: Optional[int] = None,
+        anticipated_part_size: Optional[int] = None,
+    ) -> None:
+        """Check size and quantity of parts"""
 
-    return exception
+        # check the part quantity:
+        if "Parts" not in parts_info or len(parts_info["Parts"]) == 0:
+            raise MultiPartUploadConfirmError(
+                upload_id=upload_id,
+                bucket_id=bucket_id,
+                object_id=object_id,
+                reason="Zero parts received.",
+            )
 
+        part_quantity = len(parts_info["Parts"])
+        if (
+            anticipated_part_quantity is not None
+            and part_quantity != anticipated_part_quantity
+        ):
+            raise MultiPartUploadConfirmError(
+                upload_id=upload_id,
+                bucket_id=bucket_id,
+                object_id=object_id,
+                reason=f"Found {part_quantity} parts but expect"
+                + f" {anticipated_part_quantity}.",
+            )
 
-class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-attributes
+        # check anticipated part size:
+        first_part_size = parts_info["Parts"][0]["Size"]
+        last_part_size = parts_info["Parts"][-1]["Size"]
+        if anticipated_part_size is not None:
+            if (
+                anticipated_part_quantity is not None
+                and anticipated_part_quantity > 1
+                and first_part_size != anticipated_part_size
+            ):
+                raise MultiPartUploadConfirmError(
+                    upload_id=upload_id,
+                    bucket_id=bucket_id,
+                    object_id=object_id,
+                    reason=f"The first part has a size of {first_part_size} bytes but"
+                    + f" expected {anticipated_part_quantity}.",
+                )
+            if last_part_size > anticipated_part_size:
+                raise MultiPartUploadConfirmError(
+                    upload_id=upload_id,
+                    bucket_id=bucket_id,
+                    object_id=object_id,
+                    reason=f"The last part has a size of {last_part_size} bytes which"
+                    + " is larger than the anticipated size of"
+                    + f" {anticipated_part_quantity}.",
+                )
+
+        # check if the last part is not larger than the first one:
+        if last_part_size > first_part_size:
+            raise MultiPartUploadConfirmError(
+                upload_id=upload_id,
+                bucket_id=bucket_id,
+                object_id=object_id,
+                reason=f"The last part has a size of {last_part_size} bytes which"
+                + " is larger than the size of the first part that was"
+                + f" {first_part_size}.",
+            )
+
+        # check if all parts (except the last one) conform to the size of the first one:
+        for part in parts_info["Parts"][1 : part_quantity - 1]:
+            if part["Size"] != first_part_size:
+                raise MultiPartUploadConfirmError(
+                    upload_id=upload_id,
+                    bucket_id=bucket_id,
+                    object_id=object_id,
+                    reason=f"Part number {part['PartNumber']} has a size of"
+                    + f" {part['Size']} bytes which is different than the size of the"
+                    + f" first part {first_part_size}.",
+                )
+
+    @staticmethod
+    def _get_presigned_post_params(
+        bucket_id: str,
+        object_id: str,
+        expires_after: int,
+        max_upload_size: Optional[int],
+    ) -> dict:
+        """Returns the arguments for the `generate_presigned_post` method of the
+        client."""
+        return {
+            "Bucket": bucket_id,
+            "Key": object_id,
+            "Conditions": _get_upload_conditions(max_upload_size),
+            "ExpiresIn": expires_after,
+        }
+
+    @staticmethod
+    def _get_presigned_part_params(
+        upload_id: str, bucket_id: str, object_id: str, part_number: int
+    ) -> dict:
+        """Returns the arguments for the `generate_presigned_url` method of the client
+        to presign the upload of a part."""
+        return {
+            "ClientMethod": "upload_part",
+            "Params": {
+                "Bucket": bucket_id,
+                "Key": object_id,
+                "UploadId": upload_id,
+                "PartNumber": part_number,
+            },
+            "ExpiresIn": PART_UPLOAD_URL_EXPIRY,
+        }
+
+    def _sign_get_object_url(
+        self, bucket_id: str, object_id: str, expires_after: int
+    ) -> str:
+        """Generates a presigned path-style URL for downloading the object with the
+        specified ID (`object_id`) from the bucket with the specified ID (`bucket_id`)
+        without using botocore's generic request signing.
+        """
+        if self._client is None:
+            raise OutOfContextError()
+
+        endpoint = urlsplit(self.endpoint_url)
+        host = _get_host(endpoint)
+
+        canonical_uri = (
+            f"{endpoint.path.rstrip('/')}/{quote(bucket_id, safe='-_.~')}"
+            + f"/{quote(object_id, safe='-_.~')}"
+        )
+        query = _presign_get_request(
+            host=host,
+            canonical_uri=canonical_uri,
+            region=self._client.meta.region_name or "us-east-1",
+            access_key_id=self._config.s3_access_key_id,
+            secret_access_key=self._config.s3_secret_access_key,
+            expires_after=expires_after,
+            timestamp=datetime.now(timezone.utc),
+        )
+
+        return f"{endpoint.scheme}://{host}{canonical_uri}?{query}"
+
+    def _sign_post_object_url(
+        self,
+        bucket_id: str,
+        object_id: str,
+        expires_after: int,
+        max_upload_size: Optional[int],
+    ) -> dict:
+        """Generates a presigned path-style POST URL and the corresponding form fields
+        for uploading the object with the specified ID (`object_id`) to the bucket with
+        the specified ID (`bucket_id`) without using botocore's generic request
+        signing. The result has the same structure as the one of boto3's
+        `generate_presigned_post`.
+        """
+        if self._client is None:
+            raise OutOfContextError()
+
+        endpoint = urlsplit(self.endpoint_url)
+        fields = _presign_post_request(
+            bucket_id=bucket_id,
+            object_id=object_id,
+            conditions=_get_upload_conditions(max_upload_size),
+            region=self._client.meta.region_name or "us-east-1",
+            access_key_id=self._config.s3_access_key_id,
+            secret_access_key=self._config.s3_secret_access_key,
+            expires_after=expires_after,
+            timestamp=datetime.now(timezone.utc),
+        )
+
+        url = (
+            f"{endpoint.scheme}://{_get_host(endpoint)}{endpoint.path.rstrip('/')}"
+            + f"/{quote(bucket_id, safe='-_.~')}"
+        )
+        return {"url": url, "fields": fields}
+
+
+class ObjectStorageS3(_ObjectStorageS3Base, ObjectStorageDao):
     """
     An implementation of the ObjectStorageDao interface for interacting specifically
     with S3 object storages.
@@ -193,6 +804,8 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
     def __init__(  # pylint: disable=too-many-arguments
         self,
         config: S3ConfigBase,
+        cache_object_existence: bool = False,
+        _client: Optional[botocore.client.BaseClient] = None,
     ):
         """Initialize with parameters needed to connect to the S3 storage
 
@@ -202,73 +815,74 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
 
         Args:
             config (S3ConfigBase): Config parameters specified using the S3ConfigBase model.
+            cache_object_existence (bool, optional):
+                If True, the existence of objects is remembered for a short time
+                (`OBJECT_EXISTENCE_CACHE_TTL`) to save requests. Objects deleted by
+                other clients in the meantime are still reported as existing, thus,
+                this should only be enabled if this DAO instance is the only one
+                deleting objects, e.g. in tests. Defaults to False.
+            _client (Optional[botocore.client.BaseClient], optional):
+                An existing S3 client that is used instead of creating a new one on
+                `__enter__`. It is shared with its other users and, thus, not closed
+                on `__exit__`. Only intended for testing. Defaults to None.
         """
         super().__init__(config)
-        self._config = config
-
-        self.endpoint_url = config.s3_endpoint_url
-
-        self._advanced_config = (
-            None
-            if config.aws_config_ini is None
-            else read_aws_config_ini(config.aws_config_ini)
+        self._cache_object_existence = cache_object_existence
+        self._shared_client = _client
+        self._existing_objects_cache = self._new_existing_objects_cache()
+
+    def _new_existing_objects_cache(self) -> _LRUCache:
+        """Returns an empty cache for the existence of objects. If caching is not
+        enabled, the cache does not keep any entries."""
+        return _LRUCache(
+            maxsize=OBJECT_EXISTENCE_CACHE_SIZE if self._cache_object_existence else 0,
+            ttl=OBJECT_EXISTENCE_CACHE_TTL,
         )
 
-        # will be set on __enter__:
-        self._client: Optional[botocore.client.BaseClient] = None
-        self._resource: Optional[botocore.client.BaseClient] = None
-
     def __repr__(self) -> str:
         return f"ObjectStorageS3(config=S3ConfigBase(s3_endpoint_url={self.endpoint_url}, ...))"
 
     def __enter__(self) -> "ObjectStorageS3":
         """Setup storage connection/session."""
 
-        self._client = boto3.client(
-            service_name="s3",
-            endpoint_url=self.endpoint_url,
-            aws_access_key_id=self._config.s3_access_key_id,
-            aws_secret_access_key=self._config.s3_secret_access_key,
-            aws_session_token=self._config.s3_session_token,
-            config=self._advanced_config,
+        self._client = (
+            _create_s3_client(self._config)
+            if self._shared_client is None
+            else self._shared_client
         )
 
-        self._resource = boto3.resource(
-            service_name="s3",
-            endpoint_url=self.endpoint_url,
-            aws_access_key_id=self._config.s3_access_key_id,
-            aws_secret_access_key=self._config.s3_secret_access_key,
-            aws_session_token=self._config.s3_session_token,
-            config=self._advanced_config,
-        )
+        self._clear_presigned_url_cache()
+        self._existing_objects_cache = self._new_existing_objects_cache()
 
         return self
 
     def __exit__(self, err_type, err_value, err_traceback):
         """Teardown storage connection/session"""
-        # no special teardown is needed for this DAO implementation,
-        # just deleting the reference to the client instance:
+        # the connections of a shared client are left open for its other users:
+        if self._client is not None and self._shared_client is None:
+            self._client.close()
         self._client = None
 
     def does_bucket_exist(self, bucket_id: str) -> bool:
         """Check whether a bucket with the specified ID (`bucket_id`) exists.
-        Return `True` if it exists and `False` otherwise.
+        Return `True` if it exists and `False` otherwise (also if it exists but is not
+        accessible).
         """
-        if not isinstance(self._client, botocore.client.BaseClient):
+        if self._client is None:
             raise OutOfContextError()
 
         validate_bucket_id(bucket_id)
 
         try:
-            bucket_list = self._client.list_buckets()
+            self._client.head_bucket(Bucket=bucket_id)
         except botocore.exceptions.ClientError as error:
-            raise _translate_s3_client_errors(error, bucket_id=bucket_id) from error
-
-        for bucket in bucket_list["Buckets"]:
-            if bucket["Name"] == bucket_id:
-                return True
+            # buckets that are not accessible with the used credentials, e.g. because
+            # they are owned by another account, are reported as non-existing:
+            if self._is_not_found_error(error) or self._is_access_denied_error(error):
+                return False
+            raise self._translate_client_error(error, bucket_id=bucket_id) from error
 
-        return False
+        return True
 
     def _assert_bucket_exists(self, bucket_id: str) -> None:
         """Checks if the bucket with specified ID (`bucket_id`) exists and throws an
@@ -289,7 +903,7 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
         Create a bucket (= a structure that can hold multiple file objects) with the
         specified unique ID.
         """
-        if not isinstance(self._client, botocore.client.BaseClient):
+        if self._client is None:
             raise OutOfContextError()
 
         validate_bucket_id(bucket_id)
@@ -299,7 +913,7 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
         try:
             self._client.create_bucket(Bucket=bucket_id)
         except botocore.exceptions.ClientError as error:
-            raise _translate_s3_client_errors(error, bucket_id=bucket_id) from error
+            raise self._translate_client_error(error, bucket_id=bucket_id) from error
 
     def delete_bucket(self, bucket_id: str, delete_content: bool = False) -> None:
         """
@@ -308,20 +922,59 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
         will be deleted, if False (the default) an Error will be raised if the bucket is
         not empty.
         """
-        if not isinstance(self._resource, boto3.resources.factory.ServiceResource):
+        if self._client is None:
             raise OutOfContextError()
 
         validate_bucket_id(bucket_id)
 
-        self._assert_bucket_exists(bucket_id)
-
+        # The existence of the bucket is not checked upfront, S3 reports a
+        # "NoSuchBucket" error which is translated into a BucketNotFoundError:
         try:
-            bucket = self._resource.Bucket(bucket_id)
             if delete_content:
-                bucket.objects.all().delete()
-            bucket.delete()
+                # this also discards the cached existence of the contained objects:
+                self._delete_bucket_content(bucket_id)
+            else:
+                self._existing_objects_cache.discard_where(
+                    lambda key: key[0] == bucket_id
+                )
+            self._client.delete_bucket(Bucket=bucket_id)
         except botocore.exceptions.ClientError as error:
-            raise _translate_s3_client_errors(error, bucket_id=bucket_id) from error
+            raise self._translate_client_error(error, bucket_id=bucket_id) from error
+
+    def _delete_bucket_content(self, bucket_id: str) -> None:
+        """Delete all objects contained in the bucket with the specified ID
+        (`bucket_id`). Objects are listed page by page and each page is removed using
+        a single DeleteObjects request. These requests are sent in parallel.
+        """
+        if self._client is None:
+            raise OutOfContextError()
+
+        self._existing_objects_cache.discard_where(lambda key: key[0] == bucket_id)
+
+        client = self._client
+        paginator = client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(
+            Bucket=bucket_id, PaginationConfig={"PageSize": LIST_OBJECTS_PAGE_SIZE}
+        )
+
+        def delete_keys(keys: list) -> None:
+            # "Quiet" mode omits the successfully deleted keys from the response:
+            client.delete_objects(
+                Bucket=bucket_id, Delete={"Objects": keys, "Quiet": True}
+            )
+
+        with ThreadPoolExecutor(max_workers=DELETE_OBJECTS_MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(
+                    delete_keys, [{"Key": obj["Key"]} for obj in page["Contents"]]
+                )
+                for page in pages
+                if page.get("Contents")
+            ]
+
+            # propagate errors of any of the requests:
+            for future in futures:
+                future.result()
 
     def does_object_exist(
         self, bucket_id: str, object_id: str, object_md5sum: Optional[str] = None
@@ -331,7 +984,7 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
         may be provided to check the objects content.
         Return `True` if checks succeed and `False` otherwise.
         """
-        if not isinstance(self._client, botocore.client.BaseClient):
+        if self._client is None:
             raise OutOfContextError()
 
         if object_md5sum is not None:
@@ -340,6 +993,9 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
         validate_bucket_id(bucket_id)
         validate_object_id(object_id)
 
+        if self._existing_objects_cache.get((bucket_id, object_id)):
+            return True
+
         try:
             _ = self._client.head_object(
                 Bucket=bucket_id,
@@ -348,18 +1004,90 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
         except botocore.exceptions.ClientError:
             return False
 
+        self._existing_objects_cache.put((bucket_id, object_id), True)
         return True
 
+    def do_objects_exist(
+        self, bucket_id: str, object_ids: List[str]
+    ) -> Dict[str, bool]:
+        """Check for multiple objects (`object_ids`) whether they exist in the bucket
+        with the specified id (`bucket_id`).
+        Returns a dictionary mapping each object ID to `True` if it exists and `False`
+        otherwise.
+        Instead of one request per object, the keys sharing the longest common prefix
+        of the object IDs are listed, which needs one request per 1000 keys. The
+        listing stops once all objects are found or listed keys are past the remaining
+        object IDs. At most one page per object ID is listed, the objects that are
+        still unresolved then are checked one by one.
+        """
+        if self._client is None:
+            raise OutOfContextError()
+
+        validate_bucket_id(bucket_id)
+        for object_id in object_ids:
+            validate_object_id(object_id)
+
+        if not object_ids:
+            return {}
+
+        paginator = self._client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(
+            Bucket=bucket_id,
+            Prefix=os.path.commonprefix(object_ids),
+            PaginationConfig={"PageSize": LIST_OBJECTS_PAGE_SIZE},
+        )
+
+        existing_object_ids: Set[str] = set()
+        unresolved_object_ids = set(object_ids)
+
+        try:
+            # pages are only requested while iterating:
+            for page_number, page in enumerate(pages, start=1):
+                keys = [obj["Key"] for obj in page.get("Contents", [])]
+                found_object_ids = unresolved_object_ids.intersection(keys)
+                existing_object_ids.update(found_object_ids)
+                unresolved_object_ids.difference_update(found_object_ids)
+
+                # keys are listed in lexicographical order, the unresolved objects do
+                # not exist once the listing has passed all of them:
+                if not unresolved_object_ids or (
+                    keys and keys[-1] >= max(unresolved_object_ids)
+                ):
+                    unresolved_object_ids.clear()
+                    break
+
+                # listing further pages would take more requests than checking the
+                # unresolved objects one by one (e.g. if the IDs share no prefix):
+                if page_number >= len(object_ids):
+                    break
+            else:
+                unresolved_object_ids.clear()
+        except botocore.exceptions.ClientError as error:
+            if not self._is_not_found_error(error):
+                raise self._translate_client_error(
+                    error, bucket_id=bucket_id
+                ) from error
+            unresolved_object_ids.clear()
+
+        existing_object_ids.update(
+            object_id
+            for object_id in unresolved_object_ids
+            if self.does_object_exist(bucket_id=bucket_id, object_id=object_id)
+        )
+
+        return {object_id: object_id in existing_object_ids for object_id in object_ids}
+
     def _assert_object_exists(self, bucket_id: str, object_id: str) -> None:
         """Checks if the file with specified ID (`object_id`) exists in the bucket with
         the specified ID (`bucket_id`) and throws an ObjectNotFoundError otherwise.
         If the bucket does not exist it throws a BucketNotFoundError.
         """
-        # first check if bucket exists:
-        self._assert_bucket_exists(bucket_id)
+        if self.does_object_exist(bucket_id=bucket_id, object_id=object_id):
+            return
 
-        if not self.does_object_exist(bucket_id=bucket_id, object_id=object_id):
-            raise ObjectNotFoundError(bucket_id=bucket_id, object_id=object_id)
+        # only check the bucket to find out which error to raise:
+        self._assert_bucket_exists(bucket_id)
+        raise ObjectNotFoundError(bucket_id=bucket_id, object_id=object_id)
 
     def _assert_object_not_exists(self, bucket_id: str, object_id: str) -> None:
         """Checks if the file with specified ID (`object_id`) exists in the bucket with
@@ -372,6 +1100,28 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
         if self.does_object_exist(bucket_id=bucket_id, object_id=object_id):
             raise ObjectAlreadyExistsError(bucket_id=bucket_id, object_id=object_id)
 
+    def _get_or_sign_url(
+        self, cache_key: Hashable, expires_after: int, sign: Callable[[], T]
+    ) -> T:
+        """Returns the presigned URL cached for the `cache_key` if it is still valid
+        for almost the entire requested duration (`expires_after` in seconds, see
+        `_get_presigned_url_max_age`). Otherwise, a new URL is presigned by calling
+        `sign` and cached."""
+        presigned_url = self._get_cached_url(cache_key, expires_after=expires_after)
+
+        if presigned_url is None:
+            # the age of the URL is measured from the moment it is signed:
+            signed_at = time.monotonic()
+            presigned_url = sign()
+            self._cache_url(
+                cache_key,
+                expires_after=expires_after,
+                presigned_url=presigned_url,
+                signed_at=signed_at,
+            )
+
+        return presigned_url
+
     def get_object_upload_url(
         self,
         bucket_id: str,
@@ -384,7 +1134,7 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
         You may also specify a custom expiry duration in seconds (`expires_after`) and
         a maximum size (bytes) for uploads (`max_upload_size`).
         """
-        if not isinstance(self._client, botocore.client.BaseClient):
+        if self._client is None:
             raise OutOfContextError()
 
         validate_bucket_id(bucket_id)
@@ -392,29 +1142,40 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
 
         self._assert_object_not_exists(bucket_id=bucket_id, object_id=object_id)
 
-        conditions = (
-            []
-            if max_upload_size is None
-            else [
-                # set upload size limit:
-                ["content-length-range", 0, max_upload_size],
-            ]
-        )
+        client = self._client
 
-        try:
-            presigned_url = self._client.generate_presigned_post(
-                Bucket=bucket_id,
-                Key=object_id,
-                Conditions=conditions,
-                ExpiresIn=expires_after,
-            )
-        except botocore.exceptions.ClientError as error:
-            raise _translate_s3_client_errors(
-                error, bucket_id=bucket_id, object_id=object_id
-            ) from error
+        def sign() -> dict:
+            """Presigns the POST request."""
+            if self._sign_urls_locally:
+                return self._sign_post_object_url(
+                    bucket_id=bucket_id,
+                    object_id=object_id,
+                    expires_after=expires_after,
+                    max_upload_size=max_upload_size,
+                )
+            try:
+                return client.generate_presigned_post(
+                    **self._get_presigned_post_params(
+                        bucket_id=bucket_id,
+                        object_id=object_id,
+                        expires_after=expires_after,
+                        max_upload_size=max_upload_size,
+                    )
+                )
+            except botocore.exceptions.ClientError as error:
+                raise self._translate_client_error(
+                    error, bucket_id=bucket_id, object_id=object_id
+                ) from error
+
+        presigned_url = self._get_or_sign_url(
+            cache_key=("post", bucket_id, object_id, expires_after, max_upload_size),
+            expires_after=expires_after,
+            sign=sign,
+        )
 
+        # the fields are copied so that callers cannot modify the cached ones:
         return PresignedPostURL(
-            url=presigned_url["url"], fields=presigned_url["fields"]
+            url=presigned_url["url"], fields=deepcopy(presigned_url["fields"])
         )
 
     def _list_mulitpart_upload_for_object(
@@ -426,7 +1187,7 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
         (S3 allows multiple ongoing multi-part uploads.)
         """
 
-        if not isinstance(self._client, botocore.client.BaseClient):
+        if self._client is None:
             raise OutOfContextError()
 
         try:
@@ -434,19 +1195,11 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
                 Bucket=bucket_id,
             )
         except botocore.exceptions.ClientError as error:
-            raise _translate_s3_client_errors(
+            raise self._translate_client_error(
                 error, bucket_id=bucket_id, object_id=object_id
             ) from error
 
-        if "Uploads" in uploads_info:
-            upload_list = uploads_info["Uploads"]
-            return [
-                upload["UploadId"]
-                for upload in upload_list
-                if upload["Key"] == object_id
-            ]
-
-        return []
+        return self._get_upload_ids(uploads_info, object_id=object_id)
 
     def _assert_no_multipart_upload(self, bucket_id: str, object_id: str):
         """Ensure that there are no active multi-part uploads for the given object."""
@@ -472,29 +1225,23 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
         By default, it is also verified that this upload is the only upload active for
         that file. Otherwise, raises
         """
-        if not isinstance(self._client, botocore.client.BaseClient):
+        if self._client is None:
             raise OutOfContextError()
 
         upload_ids = self._list_mulitpart_upload_for_object(
             bucket_id=bucket_id, object_id=object_id
         )
-        n_uploads = len(upload_ids)
-
-        if assert_exclusiveness and n_uploads > 1:
-            raise MultipleActiveUploadsError(
-                bucket_id=bucket_id, object_id=object_id, upload_ids=upload_ids
-            )
-
-        if upload_id not in upload_ids:
-            raise MultiPartUploadNotFoundError(
-                upload_id=upload_id,
-                bucket_id=bucket_id,
-                object_id=object_id,
-            )
+        self._check_upload_ids(
+            upload_ids,
+            upload_id=upload_id,
+            bucket_id=bucket_id,
+            object_id=object_id,
+            assert_exclusiveness=assert_exclusiveness,
+        )
 
     def init_multipart_upload(self, bucket_id: str, object_id: str) -> str:
         """Initiates a mulipart upload procedure. Returns the upload ID."""
-        if not isinstance(self._client, botocore.client.BaseClient):
+        if self._client is None:
             raise OutOfContextError()
 
         self._assert_no_multipart_upload(bucket_id=bucket_id, object_id=object_id)
@@ -504,7 +1251,7 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
                 Bucket=bucket_id, Key=object_id
             )
         except botocore.exceptions.ClientError as error:
-            raise _translate_s3_client_errors(
+            raise self._translate_client_error(
                 error, bucket_id=bucket_id, object_id=object_id
             ) from error
 
@@ -519,33 +1266,40 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
         Please note: the part number must be a non-zero, positive integer and parts
         should be uploaded in sequence.
         """
-        if not isinstance(self._client, botocore.client.BaseClient):
+        if self._client is None:
             raise OutOfContextError()
 
-        if not 0 < part_number <= 10000:
-            raise ValueError(
-                "The part number must be a non-zero positive integer"
-                + " smaller or equal to 10000"
-            )
+        self._validate_part_number(part_number)
 
         self._assert_multipart_upload_exist(
             upload_id=upload_id, bucket_id=bucket_id, object_id=object_id
         )
 
-        try:
-            return self._client.generate_presigned_url(
-                ClientMethod="upload_part",
-                Params={
-                    "Bucket": bucket_id,
-                    "Key": object_id,
-                    "UploadId": upload_id,
-                    "PartNumber": part_number,
-                },
-            )
-        except botocore.exceptions.ClientError as error:
-            raise _translate_s3_client_errors(
-                error, upload_id=upload_id, bucket_id=bucket_id, object_id=object_id
-            ) from error
+        client = self._client
+
+        def sign() -> str:
+            """Presigns the part upload request."""
+            try:
+                return client.generate_presigned_url(
+                    **self._get_presigned_part_params(
+                        upload_id=upload_id,
+                        bucket_id=bucket_id,
+                        object_id=object_id,
+                        part_number=part_number,
+                    )
+                )
+            except botocore.exceptions.ClientError as error:
+                raise self._translate_client_error(
+                    error, upload_id=upload_id, bucket_id=bucket_id, object_id=object_id
+                ) from error
+
+        # parts are often re-uploaded after failures, the URL is cached like the
+        # object URLs (the existence of the upload is checked nevertheless):
+        return self._get_or_sign_url(
+            cache_key=("upload_part", upload_id, bucket_id, object_id, part_number),
+            expires_after=PART_UPLOAD_URL_EXPIRY,
+            sign=sign,
+        )
 
     def _get_parts_info(
         self,
@@ -555,7 +1309,7 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
     ) -> dict:
         """Get information on parts uploaded as part of the specified multi-part upload."""
 
-        if not isinstance(self._client, botocore.client.BaseClient):
+        if self._client is None:
             raise OutOfContextError()
 
         self._assert_multipart_upload_exist(
@@ -569,96 +1323,10 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
                 UploadId=upload_id,
             )
         except botocore.exceptions.ClientError as error:
-            raise _translate_s3_client_errors(
+            raise self._translate_client_error(
                 error, upload_id=upload_id, bucket_id=bucket_id, object_id=object_id
             ) from error
 
-    # pylint: disable=too-many-arguments
-    def _check_uploaded_parts(
-        self,
-        upload_id: str,
-        bucket_id: str,
-        object_id: str,
-        parts_info: dict,
-        anticipated_part_quantity: Optional[int] = None,
-        anticipated_part_size: Optional[int] = None,
-    ) -> None:
-        """Check size and quantity of parts"""
-
-        if not isinstance(self._client, botocore.client.BaseClient):
-            raise OutOfContextError()
-
-        # check the part quantity:
-        if "Parts" not in parts_info or len(parts_info["Parts"]) == 0:
-            raise MultiPartUploadConfirmError(
-                upload_id=upload_id,
-                bucket_id=bucket_id,
-                object_id=object_id,
-                reason="Zero parts received.",
-            )
-
-        part_quantity = len(parts_info["Parts"])
-        if (
-            anticipated_part_quantity is not None
-            and part_quantity != anticipated_part_quantity
-        ):
-            raise MultiPartUploadConfirmError(
-                upload_id=upload_id,
-                bucket_id=bucket_id,
-                object_id=object_id,
-                reason=f"Found {part_quantity} parts but expect"
-                + f" {anticipated_part_quantity}.",
-            )
-
-        # check anticipated part size:
-        first_part_size = parts_info["Parts"][0]["Size"]
-        last_part_size = parts_info["Parts"][-1]["Size"]
-        if anticipated_part_size is not None:
-            if (
-                anticipated_part_quantity is not None
-                and anticipated_part_quantity > 1
-                and first_part_size != anticipated_part_size
-            ):
-                raise MultiPartUploadConfirmError(
-                    upload_id=upload_id,
-                    bucket_id=bucket_id,
-                    object_id=object_id,
-                    reason=f"The first part has a size of {first_part_size} bytes but"
-                    + f" expected {anticipated_part_quantity}.",
-                )
-            if last_part_size > anticipated_part_size:
-                raise MultiPartUploadConfirmError(
-                    upload_id=upload_id,
-                    bucket_id=bucket_id,
-                    object_id=object_id,
-                    reason=f"The last part has a size of {last_part_size} bytes which"
-                    + " is larger than the anticipated size of"
-                    + f" {anticipated_part_quantity}.",
-                )
-
-        # check if the last part is not larger than the first one:
-        if last_part_size > first_part_size:
-            raise MultiPartUploadConfirmError(
-                upload_id=upload_id,
-                bucket_id=bucket_id,
-                object_id=object_id,
-                reason=f"The last part has a size of {last_part_size} bytes which"
-                + " is larger than the size of the first part that was"
-                + f" {first_part_size}.",
-            )
-
-        # check if all parts (except the last one) conform to the size of the first one:
-        for part in parts_info["Parts"][1 : part_quantity - 1]:
-            if part["Size"] != first_part_size:
-                raise MultiPartUploadConfirmError(
-                    upload_id=upload_id,
-                    bucket_id=bucket_id,
-                    object_id=object_id,
-                    reason=f"Part number {part['PartNumber']} has a size of"
-                    + f" {part['Size']} bytes which is different than the size of the"
-                    + f" first part {first_part_size}.",
-                )
-
     # pylint: disable=too-many-arguments
     def abort_multipart_upload(
         self,
@@ -670,7 +1338,7 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
         deleted.
         """
 
-        if not isinstance(self._client, botocore.client.BaseClient):
+        if self._client is None:
             raise OutOfContextError()
 
         self._assert_multipart_upload_exist(
@@ -689,7 +1357,7 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
                 UploadId=upload_id,
             )
         except botocore.exceptions.ClientError as error:
-            raise _translate_s3_client_errors(
+            raise self._translate_client_error(
                 error, upload_id=upload_id, bucket_id=bucket_id, object_id=object_id
             ) from error
 
@@ -730,7 +1398,7 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
         (except the last one) have the specified size.
         """
 
-        if not isinstance(self._client, botocore.client.BaseClient):
+        if self._client is None:
             raise OutOfContextError()
 
         parts_info = self._get_parts_info(
@@ -763,7 +1431,7 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
                 UploadId=upload_id,
             )
         except botocore.exceptions.ClientError as error:
-            raise _translate_s3_client_errors(
+            raise self._translate_client_error(
                 error, upload_id=upload_id, bucket_id=bucket_id, object_id=object_id
             ) from error
 
@@ -774,7 +1442,7 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
         the specified ID (`object_id`) from bucket with the specified id (`bucket_id`).
         You may also specify a custom expiry duration in seconds (`expires_after`).
         """
-        if not isinstance(self._client, botocore.client.BaseClient):
+        if self._client is None:
             raise OutOfContextError()
 
         validate_bucket_id(bucket_id)
@@ -782,18 +1450,32 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
 
         self._assert_object_exists(bucket_id=bucket_id, object_id=object_id)
 
-        try:
-            presigned_url = self._client.generate_presigned_url(
-                "get_object",
-                Params={"Bucket": bucket_id, "Key": object_id},
-                ExpiresIn=expires_after,
-            )
-        except botocore.exceptions.ClientError as error:
-            raise _translate_s3_client_errors(
-                error, bucket_id=bucket_id, object_id=object_id
-            ) from error
+        client = self._client
 
-        return presigned_url
+        def sign() -> str:
+            """Presigns the GET request."""
+            if self._sign_urls_locally:
+                return self._sign_get_object_url(
+                    bucket_id=bucket_id,
+                    object_id=object_id,
+                    expires_after=expires_after,
+                )
+            try:
+                return client.generate_presigned_url(
+                    "get_object",
+                    Params={"Bucket": bucket_id, "Key": object_id},
+                    ExpiresIn=expires_after,
+                )
+            except botocore.exceptions.ClientError as error:
+                raise self._translate_client_error(
+                    error, bucket_id=bucket_id, object_id=object_id
+                ) from error
+
+        return self._get_or_sign_url(
+            cache_key=("get", bucket_id, object_id, expires_after),
+            expires_after=expires_after,
+            sign=sign,
+        )
 
     def copy_object(
         self,
@@ -805,7 +1487,7 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
         """Copy an object from one bucket(`source_bucket_id` and `source_object_id`) to
         another bucket (`dest_bucket_id` and `dest_object_id`).
         """
-        if not isinstance(self._client, botocore.client.BaseClient):
+        if self._client is None:
             raise OutOfContextError()
 
         validate_bucket_id(source_bucket_id)
@@ -831,7 +1513,9 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
                 Key=dest_object_id,
             )
         except botocore.exceptions.ClientError as error:
-            raise _translate_s3_client_errors(error) from error
+            raise self._translate_client_error(error) from error
+
+        self._existing_objects_cache.put((dest_bucket_id, dest_object_id), True)
 
     def delete_object(
         self, bucket_id: str, object_id: str, expires_after: int = 86400
@@ -840,13 +1524,14 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
         id (`object_id`) to the bucket with the specified id (`bucket_id`).
         You may also specify a custom expiry duration in seconds (`expires_after`).
         """
-        if not isinstance(self._client, botocore.client.BaseClient):
+        if self._client is None:
             raise OutOfContextError()
 
         validate_bucket_id(bucket_id)
         validate_object_id(object_id)
 
         self._assert_object_exists(bucket_id=bucket_id, object_id=object_id)
+        self._existing_objects_cache.discard((bucket_id, object_id))
 
         try:
             self._client.delete_object(
@@ -854,6 +1539,6 @@ class ObjectStorageS3(ObjectStorageDao):  # pylint: disable=too-many-instance-at
                 Key=object_id,
             )
         except botocore.exceptions.ClientError as error:
-            raise _translate_s3_client_errors(
+            raise self._translate_client_error(
                 error, bucket_id=bucket_id, object_id=object_id
             ) from error
@@ -0,0 +1,758 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This modules contains logic for interacting with S3-compatible object storage using
+asyncio. It mirrors the synchronous implementation of the `s3` module.
+"""
+
+import asyncio
+import time
+from contextlib import AsyncExitStack
+from copy import deepcopy
+from typing import Awaitable, Callable, Hashable, Iterable, List, Optional, TypeVar
+
+import aioboto3
+import botocore.exceptions
+
+from .object_storage_dao import (
+    BucketAlreadyExists,
+    BucketNotFoundError,
+    MultiPartUploadAbortError,
+    MultiPartUploadAlreadyExistsError,
+    MultiPartUploadNotFoundError,
+    ObjectAlreadyExistsError,
+    ObjectNotFoundError,
+    PresignedPostURL,
+    validate_bucket_id,
+    validate_object_id,
+)
+from .s3 import (
+    LIST_OBJECTS_PAGE_SIZE,
+    PART_UPLOAD_URL_EXPIRY,
+    S3ConfigBase,
+    _ObjectStorageS3Base,
+)
+from .utils import AsyncDaoGenericBase, OutOfContextError
+
+T = TypeVar("T")
+
+# the default number of S3 requests that may be in flight at the same time:
+DEFAULT_MAX_CONCURRENCY = 10
+
+
+async def _gather_or_cancel(*aws: Awaitable[T]) -> List[T]:
+    """Run the specified awaitables (`aws`) concurrently and return their results in
+    order. If one of them fails, the others are cancelled before the error is raised,
+    so that no requests are left running in the background.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        # wait until the cancellation is complete, the errors are already handled:
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+class AsyncObjectStorageS3(_ObjectStorageS3Base, AsyncDaoGenericBase):
+    """
+    An asynchronous implementation of the ObjectStorageDao interface for interacting
+    specifically with S3 object storages. Independent requests issued by operations
+    on multiple objects are sent concurrently.
+    Exceptions may include:
+        - NotImplementedError
+        - ObjectStorageDaoError, or derived exceptions:
+            - OutOfContextError (if the context manager protocol is not used correctly)
+            - BucketError, or derived exceptions:
+                - BucketIdValidationError
+                - BucketNotFoundError
+                - BucketAlreadyExists
+            - ObjectError, or derived exceptions:
+                - ObjectIdValidationError
+                - ObjectNotFoundError
+                - ObjectAlreadyExistsError
+    """
+
+    def __init__(
+        self,
+        config: S3ConfigBase,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        """Initialize with parameters needed to connect to the S3 storage
+
+        Args:
+            config (S3ConfigBase): Config parameters specified using the S3ConfigBase model.
+            max_concurrency (int):
+                The maximum number of requests that are sent concurrently when
+                operating on multiple objects. Defaults to 10.
+        """
+        super().__init__(config)
+        self.max_concurrency = max_concurrency
+
+        # will be set on __aenter__:
+        self._exit_stack: Optional[AsyncExitStack] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def __repr__(self) -> str:
+        return f"AsyncObjectStorageS3(config=S3ConfigBase(s3_endpoint_url={self.endpoint_url}, ...))"
+
+    async def __aenter__(self) -> "AsyncObjectStorageS3":
+        """Setup storage connection/session."""
+
+        session = aioboto3.Session(
+            aws_access_key_id=self._config.s3_access_key_id,
+            aws_secret_access_key=self._config.s3_secret_access_key,
+            aws_session_token=self._config.s3_session_token,
+        )
+
+        self._exit_stack = AsyncExitStack()
+        self._client = await self._exit_stack.enter_async_context(
+            session.client(
+                service_name="s3",
+                endpoint_url=self.endpoint_url,
+                config=self._advanced_config,
+            )
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._clear_presigned_url_cache()
+
+        return self
+
+    async def __aexit__(self, err_type, err_value, err_traceback):
+        """Teardown storage connection/session"""
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+
+        self._client = None
+        self._exit_stack = None
+        self._semaphore = None
+
+    async def _gather_bounded(self, aws: Iterable[Awaitable[T]]) -> List[T]:
+        """Run the specified awaitables (`aws`) concurrently, but never more than
+        `max_concurrency` at the same time. Returns their results in order. If one of
+        them fails, the others are cancelled.
+        """
+        if self._semaphore is None:
+            raise OutOfContextError()
+
+        semaphore = self._semaphore
+
+        async def run_bounded(aw: Awaitable[T]) -> T:
+            async with semaphore:
+                return await aw
+
+        return await _gather_or_cancel(*(run_bounded(aw) for aw in aws))
+
+    async def does_bucket_exist(self, bucket_id: str) -> bool:
+        """Check whether a bucket with the specified ID (`bucket_id`) exists.
+        Return `True` if it exists and `False` otherwise (also if it exists but is not
+        accessible).
+        """
+        if self._client is None:
+            raise OutOfContextError()
+
+        validate_bucket_id(bucket_id)
+
+        try:
+            await self._client.head_bucket(Bucket=bucket_id)
+        except botocore.exceptions.ClientError as error:
+            # buckets that are not accessible with the used credentials, e.g. because
+            # they are owned by another account, are reported as non-existing:
+            if self._is_not_found_error(error) or self._is_access_denied_error(error):
+                return False
+            raise self._translate_client_error(error, bucket_id=bucket_id) from error
+
+        return True
+
+    async def _assert_bucket_exists(self, bucket_id: str) -> None:
+        """Checks if the bucket with specified ID (`bucket_id`) exists and throws an
+        BucketNotFoundError otherwise.
+        """
+        if not await self.does_bucket_exist(bucket_id):
+            raise BucketNotFoundError(bucket_id=bucket_id)
+
+    async def _assert_bucket_not_exists(self, bucket_id: str) -> None:
+        """Checks if the bucket with specified ID (`bucket_id`) exists. If so, it throws
+        an BucketAlreadyExists.
+        """
+        if await self.does_bucket_exist(bucket_id):
+            raise BucketAlreadyExists(bucket_id=bucket_id)
+
+    async def create_bucket(self, bucket_id: str) -> None:
+        """
+        Create a bucket (= a structure that can hold multiple file objects) with the
+        specified unique ID.
+        """
+        if self._client is None:
+            raise OutOfContextError()
+
+        validate_bucket_id(bucket_id)
+
+        await self._assert_bucket_not_exists(bucket_id)
+
+        try:
+            await self._client.create_bucket(Bucket=bucket_id)
+        except botocore.exceptions.ClientError as error:
+            raise self._translate_client_error(error, bucket_id=bucket_id) from error
+
+    async def create_buckets(self, bucket_ids: List[str]) -> None:
+        """Create multiple buckets with the specified IDs (`bucket_ids`) concurrently."""
+        await self._gather_bounded(
+            self.create_bucket(bucket_id) for bucket_id in bucket_ids
+        )
+
+    async def delete_bucket(self, bucket_id: str, delete_content: bool = False) -> None:
+        """
+        Delete a bucket (= a structure that can hold multiple file objects) with the
+        specified unique ID. If `delete_content` is set to True, any contained objects
+        will be deleted, if False (the default) an Error will be raised if the bucket is
+        not empty.
+        """
+        if self._client is None:
+            raise OutOfContextError()
+
+        validate_bucket_id(bucket_id)
+
+        # The existence of the bucket is not checked upfront, S3 reports a
+        # "NoSuchBucket" error which is translated into a BucketNotFoundError:
+        try:
+            if delete_content:
+                await self._delete_bucket_content(bucket_id)
+            await self._client.delete_bucket(Bucket=bucket_id)
+        except botocore.exceptions.ClientError as error:
+            raise self._translate_client_error(error, bucket_id=bucket_id) from error
+
+    async def _delete_bucket_content(self, bucket_id: str) -> None:
+        """Delete all objects contained in the bucket with the specified ID
+        (`bucket_id`). Objects are listed page by page and the DeleteObjects requests
+        for all pages are sent concurrently.
+        """
+        if self._client is None:
+            raise OutOfContextError()
+
+        client = self._client
+        paginator = client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(
+            Bucket=bucket_id, PaginationConfig={"PageSize": LIST_OBJECTS_PAGE_SIZE}
+        )
+
+        key_batches = [
+            [{"Key": obj["Key"]} for obj in page["Contents"]]
+            async for page in pages
+            if page.get("Contents")
+        ]
+
+        await self._gather_bounded(
+            client.delete_objects(
+                Bucket=bucket_id, Delete={"Objects": keys, "Quiet": True}
+            )
+            for keys in key_batches
+        )
+
+    async def does_object_exist(
+        self, bucket_id: str, object_id: str, object_md5sum: Optional[str] = None
+    ) -> bool:
+        """Check whether an object with specified ID (`object_id`) exists in the bucket
+        with the specified id (`bucket_id`). Optionally, a md5 checksum (`object_md5sum`)
+        may be provided to check the objects content.
+        Return `True` if checks succeed and `False` otherwise.
+        """
+        if self._client is None:
+            raise OutOfContextError()
+
+        if object_md5sum is not None:
+            raise NotImplementedError("Md5 checking is not yet implemented.")
+
+        validate_bucket_id(bucket_id)
+        validate_object_id(object_id)
+
+        try:
+            _ = await self._client.head_object(
+                Bucket=bucket_id,
+                Key=object_id,
+            )
+        except botocore.exceptions.ClientError:
+            return False
+
+        return True
+
+    async def _assert_object_exists(self, bucket_id: str, object_id: str) -> None:
+        """Checks if the file with specified ID (`object_id`) exists in the bucket with
+        the specified ID (`bucket_id`) and throws an ObjectNotFoundError otherwise.
+        If the bucket does not exist it throws a BucketNotFoundError.
+        """
+        if await self.does_object_exist(bucket_id=bucket_id, object_id=object_id):
+            return
+
+        # only check the bucket to find out which error to raise:
+        await self._assert_bucket_exists(bucket_id)
+        raise ObjectNotFoundError(bucket_id=bucket_id, object_id=object_id)
+
+    async def _assert_object_not_exists(self, bucket_id: str, object_id: str) -> None:
+        """Checks if the file with specified ID (`object_id`) exists in the bucket with
+        the specified ID (`bucket_id`). If so, it throws an ObjectAlreadyExistsError otherwise.
+        If the bucket does not exist it throws a BucketNotFoundError.
+        """
+        # first check if bucket exists:
+        await self._assert_bucket_exists(bucket_id)
+
+        if await self.does_object_exist(bucket_id=bucket_id, object_id=object_id):
+            raise ObjectAlreadyExistsError(bucket_id=bucket_id, object_id=object_id)
+
+    async def _get_or_sign_url(
+        self,
+        cache_key: Hashable,
+        expires_after: int,
+        sign: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Returns the presigned URL cached for the `cache_key` if it is still valid
+        for almost the entire requested duration (`expires_after` in seconds).
+        Otherwise, a new URL is presigned by awaiting `sign` and cached."""
+        presigned_url = self._get_cached_url(cache_key, expires_after=expires_after)
+
+        if presigned_url is None:
+            # the age of the URL is measured from the moment it is signed:
+            signed_at = time.monotonic()
+            presigned_url = await sign()
+            self._cache_url(
+                cache_key,
+                expires_after=expires_after,
+                presigned_url=presigned_url,
+                signed_at=signed_at,
+            )
+
+        return presigned_url
+
+    async def get_object_upload_url(
+        self,
+        bucket_id: str,
+        object_id: str,
+        expires_after: int = 86400,
+        max_upload_size: Optional[int] = None,
+    ) -> PresignedPostURL:
+        """Generates and returns an HTTP URL to upload a new file object with the given
+        id (`object_id`) to the bucket with the specified id (`bucket_id`).
+        You may also specify a custom expiry duration in seconds (`expires_after`) and
+        a maximum size (bytes) for uploads (`max_upload_size`).
+        """
+        if self._client is None:
+            raise OutOfContextError()
+
+        validate_bucket_id(bucket_id)
+        validate_object_id(object_id)
+
+        await self._assert_object_not_exists(bucket_id=bucket_id, object_id=object_id)
+
+        client = self._client
+
+        async def sign() -> dict:
+            """Presigns the POST request."""
+            if self._sign_urls_locally:
+                return self._sign_post_object_url(
+                    bucket_id=bucket_id,
+                    object_id=object_id,
+                    expires_after=expires_after,
+                    max_upload_size=max_upload_size,
+                )
+            try:
+                return await client.generate_presigned_post(
+                    **self._get_presigned_post_params(
+                        bucket_id=bucket_id,
+                        object_id=object_id,
+                        expires_after=expires_after,
+                        max_upload_size=max_upload_size,
+                    )
+                )
+            except botocore.exceptions.ClientError as error:
+                raise self._translate_client_error(
+                    error, bucket_id=bucket_id, object_id=object_id
+                ) from error
+
+        presigned_url = await self._get_or_sign_url(
+            cache_key=("post", bucket_id, object_id, expires_after, max_upload_size),
+            expires_after=expires_after,
+            sign=sign,
+        )
+
+        # the fields are copied so that callers cannot modify the cached ones:
+        return PresignedPostURL(
+            url=presigned_url["url"], fields=deepcopy(presigned_url["fields"])
+        )
+
+    async def _list_mulitpart_upload_for_object(
+        self, bucket_id: str, object_id: str
+    ) -> list[str]:
+        """Lists all active multi-part upload for the given object. Returns a list of
+        their IDs.
+
+        (S3 allows multiple ongoing multi-part uploads.)
+        """
+
+        if self._client is None:
+            raise OutOfContextError()
+
+        try:
+            uploads_info = await self._client.list_multipart_uploads(
+                Bucket=bucket_id,
+            )
+        except botocore.exceptions.ClientError as error:
+            raise self._translate_client_error(
+                error, bucket_id=bucket_id, object_id=object_id
+            ) from error
+
+        return self._get_upload_ids(uploads_info, object_id=object_id)
+
+    async def _assert_no_multipart_upload(self, bucket_id: str, object_id: str):
+        """Ensure that there are no active multi-part uploads for the given object."""
+
+        upload_ids = await self._list_mulitpart_upload_for_object(
+            bucket_id=bucket_id, object_id=object_id
+        )
+        if len(upload_ids) > 0:
+            raise MultiPartUploadAlreadyExistsError(
+                bucket_id=bucket_id, object_id=object_id
+            )
+
+    async def _assert_multipart_upload_exist(
+        self,
+        upload_id: str,
+        bucket_id: str,
+        object_id: str,
+        assert_exclusiveness: bool = True,
+    ) -> None:
+        """Checks if a multipart upload with the given ID exists and whether it maps
+        to the specified object and bucket. Otherwise, raises UploadNotExistError.
+
+        By default, it is also verified that this upload is the only upload active for
+        that file. Otherwise, raises
+        """
+        upload_ids = await self._list_mulitpart_upload_for_object(
+            bucket_id=bucket_id, object_id=object_id
+        )
+        self._check_upload_ids(
+            upload_ids,
+            upload_id=upload_id,
+            bucket_id=bucket_id,
+            object_id=object_id,
+            assert_exclusiveness=assert_exclusiveness,
+        )
+
+    async def init_multipart_upload(self, bucket_id: str, object_id: str) -> str:
+        """Initiates a mulipart upload procedure. Returns the upload ID."""
+        if self._client is None:
+            raise OutOfContextError()
+
+        await self._assert_no_multipart_upload(bucket_id=bucket_id, object_id=object_id)
+
+        try:
+            response = await self._client.create_multipart_upload(
+                Bucket=bucket_id, Key=object_id
+            )
+        except botocore.exceptions.ClientError as error:
+            raise self._translate_client_error(
+                error, bucket_id=bucket_id, object_id=object_id
+            ) from error
+
+        return response["UploadId"]
+
+    async def get_part_upload_url(
+        self, upload_id: str, bucket_id: str, object_id: str, part_number: int
+    ) -> str:
+        """Given a id of an instantiated multipart upload along with the corresponding
+        bucket and object ID, it returns a presign URL for uploading a file part with the
+        specified number.
+        Please note: the part number must be a non-zero, positive integer and parts
+        should be uploaded in sequence.
+        """
+        if self._client is None:
+            raise OutOfContextError()
+
+        self._validate_part_number(part_number)
+
+        await self._assert_multipart_upload_exist(
+            upload_id=upload_id, bucket_id=bucket_id, object_id=object_id
+        )
+
+        client = self._client
+
+        async def sign() -> str:
+            """Presigns the part upload request."""
+            try:
+                return await client.generate_presigned_url(
+                    **self._get_presigned_part_params(
+                        upload_id=upload_id,
+                        bucket_id=bucket_id,
+                        object_id=object_id,
+                        part_number=part_number,
+                    )
+                )
+            except botocore.exceptions.ClientError as error:
+                raise self._translate_client_error(
+                    error, upload_id=upload_id, bucket_id=bucket_id, object_id=object_id
+                ) from error
+
+        return await self._get_or_sign_url(
+            cache_key=("upload_part", upload_id, bucket_id, object_id, part_number),
+            expires_after=PART_UPLOAD_URL_EXPIRY,
+            sign=sign,
+        )
+
+    async def _get_parts_info(
+        self,
+        upload_id: str,
+        bucket_id: str,
+        object_id: str,
+    ) -> dict:
+        """Get information on parts uploaded as part of the specified multi-part upload."""
+
+        if self._client is None:
+            raise OutOfContextError()
+
+        await self._assert_multipart_upload_exist(
+            upload_id=upload_id, bucket_id=bucket_id, object_id=object_id
+        )
+
+        try:
+            return await self._client.list_parts(
+                Bucket=bucket_id,
+                Key=object_id,
+                UploadId=upload_id,
+            )
+        except botocore.exceptions.ClientError as error:
+            raise self._translate_client_error(
+                error, upload_id=upload_id, bucket_id=bucket_id, object_id=object_id
+            ) from error
+
+    async def abort_multipart_upload(
+        self,
+        upload_id: str,
+        bucket_id: str,
+        object_id: str,
+    ) -> None:
+        """Abort a multipart upload with the specified ID. All uploaded content is
+        deleted.
+        """
+
+        if self._client is None:
+            raise OutOfContextError()
+
+        # Exclusiveness is not enforced here since the abortion of an upload might be
+        # used to resolve the invalid state of multiple uploads for the same object.
+        await self._assert_multipart_upload_exist(
+            upload_id=upload_id,
+            bucket_id=bucket_id,
+            object_id=object_id,
+            assert_exclusiveness=False,
+        )
+
+        try:
+            await self._client.abort_multipart_upload(
+                Bucket=bucket_id,
+                Key=object_id,
+                UploadId=upload_id,
+            )
+        except botocore.exceptions.ClientError as error:
+            raise self._translate_client_error(
+                error, upload_id=upload_id, bucket_id=bucket_id, object_id=object_id
+            ) from error
+
+        # verify that the abortion was successful as recommended by the boto3
+        # documentation:
+        try:
+            parts_info = await self._get_parts_info(
+                upload_id=upload_id,
+                bucket_id=bucket_id,
+                object_id=object_id,
+            )
+        except MultiPartUploadNotFoundError:
+            # this is proof enough that the upload was aborted:
+            return
+
+        # verify that no parts are remaining:
+        if "Parts" in parts_info and len(parts_info["Parts"]) > 0:
+            raise MultiPartUploadAbortError(
+                upload_id=upload_id, bucket_id=bucket_id, object_id=object_id
+            )
+
+    # pylint: disable=too-many-arguments
+    async def complete_multipart_upload(
+        self,
+        upload_id: str,
+        bucket_id: str,
+        object_id: str,
+        anticipated_part_quantity: Optional[int] = None,
+        anticipated_part_size: Optional[int] = None,
+    ) -> None:
+        """Completes a multipart upload with the specified ID. In addition to the
+        corresponding bucket and object id, you also specify an anticipated part size
+        and an anticipated part quantity.
+        This ensures that exactly the specified number of parts exist and that all parts
+        (except the last one) have the specified size.
+        """
+
+        if self._client is None:
+            raise OutOfContextError()
+
+        parts_info = await self._get_parts_info(
+            upload_id=upload_id,
+            bucket_id=bucket_id,
+            object_id=object_id,
+        )
+
+        self._check_uploaded_parts(
+            upload_id=upload_id,
+            bucket_id=bucket_id,
+            object_id=object_id,
+            parts_info=parts_info,
+            anticipated_part_quantity=anticipated_part_quantity,
+            anticipated_part_size=anticipated_part_size,
+        )
+
+        # construct eTags list:
+        part_etags = [
+            {"ETag": part["ETag"], "PartNumber": part["PartNumber"]}
+            for part in parts_info["Parts"]
+        ]
+
+        # confirm the upload:
+        try:
+            await self._client.complete_multipart_upload(
+                Bucket=bucket_id,
+                Key=object_id,
+                MultipartUpload={"Parts": part_etags},
+                UploadId=upload_id,
+            )
+        except botocore.exceptions.ClientError as error:
+            raise self._translate_client_error(
+                error, upload_id=upload_id, bucket_id=bucket_id, object_id=object_id
+            ) from error
+
+    async def get_object_download_url(
+        self, bucket_id: str, object_id: str, expires_after: int = 86400
+    ) -> str:
+        """Generates and returns a presigns HTTP-URL to download a file object with
+        the specified ID (`object_id`) from bucket with the specified id (`bucket_id`).
+        You may also specify a custom expiry duration in seconds (`expires_after`).
+        """
+        if self._client is None:
+            raise OutOfContextError()
+
+        validate_bucket_id(bucket_id)
+        validate_object_id(object_id)
+
+        await self._assert_object_exists(bucket_id=bucket_id, object_id=object_id)
+
+        client = self._client
+
+        async def sign() -> str:
+            """Presigns the GET request."""
+            if self._sign_urls_locally:
+                return self._sign_get_object_url(
+                    bucket_id=bucket_id,
+                    object_id=object_id,
+                    expires_after=expires_after,
+                )
+            try:
+                return await client.generate_presigned_url(
+                    "get_object",
+                    Params={"Bucket": bucket_id, "Key": object_id},
+                    ExpiresIn=expires_after,
+                )
+            except botocore.exceptions.ClientError as error:
+                raise self._translate_client_error(
+                    error, bucket_id=bucket_id, object_id=object_id
+                ) from error
+
+        return await self._get_or_sign_url(
+            cache_key=("get", bucket_id, object_id, expires_after),
+            expires_after=expires_after,
+            sign=sign,
+        )
+
+    async def copy_object(
+        self,
+        source_bucket_id: str,
+        source_object_id: str,
+        dest_bucket_id: str,
+        dest_object_id: str,
+    ) -> None:
+        """Copy an object from one bucket(`source_bucket_id` and `source_object_id`) to
+        another bucket (`dest_bucket_id` and `dest_object_id`).
+        """
+        if self._client is None:
+            raise OutOfContextError()
+
+        validate_bucket_id(source_bucket_id)
+        validate_object_id(source_object_id)
+        validate_bucket_id(dest_bucket_id)
+        validate_object_id(dest_object_id)
+
+        # both checks are independent of each other:
+        await _gather_or_cancel(
+            self._assert_object_exists(
+                bucket_id=source_bucket_id, object_id=source_object_id
+            ),
+            self._assert_object_not_exists(
+                bucket_id=dest_bucket_id, object_id=dest_object_id
+            ),
+        )
+
+        try:
+            copy_source = {
+                "Bucket": source_bucket_id,
+                "Key": source_object_id,
+            }
+            await self._client.copy(
+                CopySource=copy_source,
+                Bucket=dest_bucket_id,
+                Key=dest_object_id,
+            )
+        except botocore.exceptions.ClientError as error:
+            raise self._translate_client_error(error) from error
+
+    async def delete_object(self, bucket_id: str, object_id: str) -> None:
+        """Delete an object with the specified id (`object_id`) in the bucket with the
+        specified id (`bucket_id`).
+        """
+        if self._client is None:
+            raise OutOfContextError()
+
+        validate_bucket_id(bucket_id)
+        validate_object_id(object_id)
+
+        await self._assert_object_exists(bucket_id=bucket_id, object_id=object_id)
+
+        try:
+            await self._client.delete_object(
+                Bucket=bucket_id,
+                Key=object_id,
+            )
+        except botocore.exceptions.ClientError as error:
+            raise self._translate_client_error(
+                error, bucket_id=bucket_id, object_id=object_id
+            ) from error
+
+    async def delete_objects(self, bucket_id: str, object_ids: List[str]) -> None:
+        """Delete multiple objects with the specified IDs (`object_ids`) from the
+        bucket with the specified ID (`bucket_id`) concurrently.
+        """
+        await self._gather_bounded(
+            self.delete_object(bucket_id=bucket_id, object_id=object_id)
+            for object_id in object_ids
+        )
@@ -18,10 +18,24 @@ This module contains utilities for testing code created with the functionality
 from the `s3` module.
 """
 
+import asyncio
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Generator, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
+import botocore.client
 import pytest
 from testcontainers.localstack import LocalStackContainer
 
@@ -35,18 +49,56 @@ from ghga_service_chassis_lib.object_storage_dao_testing import (
     DEFAULT_NON_EXISTING_BUCKETS,
     DEFAULT_NON_EXISTING_OBJECTS,
     ObjectFixture,
+    calc_file_md5,
     download_and_check_test_file,
     multipart_upload_file,
     populate_storage,
     upload_file,
     upload_part,
 )
-from ghga_service_chassis_lib.s3 import ObjectStorageS3, S3ConfigBase
-
+from ghga_service_chassis_lib.s3 import (
+    LIST_OBJECTS_PAGE_SIZE,
+    ObjectStorageS3,
+    S3ConfigBase,
+    _create_s3_client,
+)
 
-def config_from_localstack_container(container: LocalStackContainer) -> S3ConfigBase:
-    """Prepares a S3ConfigBase from an instance of a localstack test container."""
-    s3_endpoint_url = container.get_url()
+if TYPE_CHECKING:
+    # only needed for type hints, aioboto3 is an optional dependency:
+    from ghga_service_chassis_lib.s3_async import AsyncObjectStorageS3
+
+__all__ = [
+    "LOCALSTACK_IMAGE",
+    "MOTO_S3_ENDPOINT_URL",
+    "REUSE_LOCALSTACK_ENV_VAR",
+    "S3Fixture",
+    "async_typical_workflow",
+    "clear_storage",
+    "config_from_localstack_container",
+    "get_initialized_upload",
+    "prepare_non_completed_upload",
+    "s3_fixture_factory",
+    "typical_workflow",
+]
+
+LOCALSTACK_IMAGE = "localstack/localstack:0.14.2"
+# set this environment variable to "0" to start a new LocalStack container per test:
+REUSE_LOCALSTACK_ENV_VAR = "GHGA_REUSE_LOCALSTACK"
+# the endpoint intercepted by moto's in-process S3 mock:
+MOTO_S3_ENDPOINT_URL = "https://s3.amazonaws.com"
+
+# the LocalStack container shared across the test session is stored in the pytest
+# config, so that the `s3_fixture` does not depend on any other fixture:
+_LOCALSTACK_CONTAINER_KEY = pytest.StashKey[LocalStackContainer]()
+
+
+def config_from_localstack_container(
+    container: Optional[LocalStackContainer],
+) -> S3ConfigBase:
+    """Prepares a S3ConfigBase from an instance of a localstack test container.
+    If no container is provided, a config for moto's in-process S3 mock is returned.
+    """
+    s3_endpoint_url = MOTO_S3_ENDPOINT_URL if container is None else container.get_url()
     return S3ConfigBase(  # nosec
         s3_endpoint_url=s3_endpoint_url,
         s3_access_key_id="test",
@@ -54,6 +106,133 @@ def config_from_localstack_container(container: LocalStackContainer) -> S3Config
     )
 
 
+def clear_storage(
+    storage: ObjectStorageS3,
+    keep_buckets: Iterable[str] = (),
+    keep_objects: Iterable[ObjectFixture] = (),
+) -> Tuple[Set[str], List[ObjectFixture]]:
+    """Abort all multipart uploads and delete all buckets including their content in
+    the storage, so that it can be reused in the next test. Buckets listed in
+    `keep_buckets` are only emptied but not deleted, so that they do not have to be
+    re-created. Objects of these buckets that match one of the `keep_objects` (same
+    ID, size, and checksum) are not deleted, so that they do not have to be uploaded
+    again. Returns the IDs of the kept buckets and the kept object fixtures that
+    exist in the storage."""
+
+    client = storage._client  # pylint: disable=protected-access
+    if client is None:
+        raise RuntimeError("The storage must be used inside of a with block.")
+
+    keep_buckets_ = set(keep_buckets)
+    kept_buckets: Set[str] = set()
+    kept_objects: List[ObjectFixture] = []
+
+    for bucket in client.list_buckets()["Buckets"]:
+        bucket_id = bucket["Name"]
+        uploads = client.list_multipart_uploads(Bucket=bucket_id).get("Uploads", [])
+        for upload in uploads:
+            client.abort_multipart_upload(
+                Bucket=bucket_id, Key=upload["Key"], UploadId=upload["UploadId"]
+            )
+
+        if bucket_id not in keep_buckets_:
+            storage.delete_bucket(bucket_id, delete_content=True)
+            continue
+
+        kept_buckets.add(bucket_id)
+        kept_objects.extend(
+            _delete_changed_objects(
+                storage,
+                bucket_id=bucket_id,
+                keep_objects=[
+                    object_fixture
+                    for object_fixture in keep_objects
+                    if object_fixture.bucket_id == bucket_id
+                ],
+            )
+        )
+
+    return kept_buckets, kept_objects
+
+
+def _delete_changed_objects(
+    storage: ObjectStorageS3, bucket_id: str, keep_objects: List[ObjectFixture]
+) -> List[ObjectFixture]:
+    """Delete all objects of the bucket with the specified ID (`bucket_id`) that do
+    not match one of the `keep_objects`. Objects uploaded in multiple parts are always
+    deleted, as their content cannot be compared to the fixture. The objects are
+    deleted using one DeleteObjects request per 1000 keys. Returns the object fixtures
+    that are still present in the bucket."""
+
+    client = storage._client  # pylint: disable=protected-access
+    if client is None:
+        raise RuntimeError("The storage must be used inside of a with block.")
+
+    if not keep_objects:
+        storage._delete_bucket_content(bucket_id)  # pylint: disable=protected-access
+        return []
+
+    fixtures_by_id = {
+        object_fixture.object_id: object_fixture for object_fixture in keep_objects
+    }
+    kept_objects: List[ObjectFixture] = []
+    changed_object_ids: List[str] = []
+
+    paginator = client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket_id):
+        for obj in page.get("Contents", []):
+            object_fixture = fixtures_by_id.get(obj["Key"])
+            # the ETag of objects uploaded in a single part is their md5 checksum:
+            if (
+                object_fixture is not None
+                and obj["Size"] == len(object_fixture.content)
+                and obj["ETag"].strip('"') == object_fixture.md5
+            ):
+                kept_objects.append(object_fixture)
+            else:
+                changed_object_ids.append(obj["Key"])
+
+    for start in range(0, len(changed_object_ids), LIST_OBJECTS_PAGE_SIZE):
+        object_ids = changed_object_ids[start : start + LIST_OBJECTS_PAGE_SIZE]
+        client.delete_objects(
+            Bucket=bucket_id,
+            Delete={
+                "Objects": [{"Key": object_id} for object_id in object_ids],
+                "Quiet": True,
+            },
+        )
+
+    # the deleted objects must not be reported as existing by the storage:
+    for object_id in changed_object_ids:
+        storage._existing_objects_cache.discard(  # pylint: disable=protected-access
+            (bucket_id, object_id)
+        )
+
+    return kept_objects
+
+
+def _get_localstack_container(request: pytest.FixtureRequest) -> LocalStackContainer:
+    """Returns a running LocalStack container for the requesting fixture. A single
+    container is started on first use and reused for the entire test session unless
+    the `GHGA_REUSE_LOCALSTACK` environment variable is set to "0", in which case
+    every test gets its own container. The containers are stopped once they are no
+    longer needed."""
+    reuse = os.environ.get(REUSE_LOCALSTACK_ENV_VAR, "1") != "0"
+    if reuse and _LOCALSTACK_CONTAINER_KEY in request.config.stash:
+        return request.config.stash[_LOCALSTACK_CONTAINER_KEY]
+
+    container = LocalStackContainer(image=LOCALSTACK_IMAGE).with_services("s3")
+    container.start()
+
+    if reuse:
+        request.config.stash[_LOCALSTACK_CONTAINER_KEY] = container
+        request.config.add_cleanup(container.stop)
+    else:
+        request.addfinalizer(container.stop)
+
+    return container
+
+
 @dataclass
 class S3Fixture:
     """Info yielded by the `s3_fixture` function"""
@@ -66,13 +245,81 @@ class S3Fixture:
     non_existing_objects: List[ObjectFixture]
 
 
+def _get_shared_client(config: S3ConfigBase) -> botocore.client.BaseClient:
+    """Returns an S3 client for the storage specified in the `config` that is shared
+    by all fixtures using the same storage, so that the service model is only loaded
+    once and the connections are reused across tests."""
+    return _get_shared_client_cached(config.json(include=set(S3ConfigBase.__fields__)))
+
+
+@lru_cache(maxsize=8)
+def _get_shared_client_cached(config_json: str) -> botocore.client.BaseClient:
+    """Creates the S3 client for the JSON-serialized S3 config (`config_json`)."""
+    return _create_s3_client(S3ConfigBase.parse_raw(config_json))
+
+
+def _populated_s3_fixture(
+    config: S3ConfigBase,
+    existing_buckets: List[str],
+    non_existing_buckets: List[str],
+    existing_objects: List[ObjectFixture],
+    non_existing_objects: List[ObjectFixture],
+) -> Generator[S3Fixture, None, None]:
+    """Connects to the storage specified in the config, removes the buckets and
+    objects of previous tests, populates the storage, and yields an S3Fixture."""
+
+    # the fixture's DAO is the only client deleting objects during a test, thus, it
+    # may cache the existence of objects:
+    with ObjectStorageS3(
+        config=config,
+        cache_object_existence=True,
+        _client=_get_shared_client(config),
+    ) as storage:
+        # the buckets and objects of the fixture are kept across tests, only the
+        # state that was changed by the previous test is reset:
+        kept_buckets, kept_objects = clear_storage(
+            storage,
+            keep_buckets=[
+                *existing_buckets,
+                *(object_fixture.bucket_id for object_fixture in existing_objects),
+            ],
+            keep_objects=existing_objects,
+        )
+        populate_storage(
+            storage=storage,
+            bucket_fixtures=[
+                bucket_id
+                for bucket_id in existing_buckets
+                if bucket_id not in kept_buckets
+            ],
+            object_fixtures=[
+                object_fixture
+                for object_fixture in existing_objects
+                if object_fixture not in kept_objects
+            ],
+        )
+
+        yield S3Fixture(
+            config=config,
+            storage=storage,
+            existing_buckets=existing_buckets,
+            non_existing_buckets=non_existing_buckets,
+            existing_objects=existing_objects,
+            non_existing_objects=non_existing_objects,
+        )
+
+
 def s3_fixture_factory(
     existing_buckets: Optional[List[str]] = None,
     non_existing_buckets: Optional[List[str]] = None,
     existing_objects: Optional[List[ObjectFixture]] = None,
     non_existing_objects: Optional[List[ObjectFixture]] = None,
+    use_moto: bool = False,
 ):
-    """A factory for generating a pre-configured Pytest fixture working with S3."""
+    """A factory for generating a pre-configured Pytest fixture working with S3.
+    By default, the fixture uses a LocalStack container. If `use_moto` is set to
+    True, the S3 API is mocked in-process using moto instead, which does not require
+    Docker but is less faithful to a real S3 service."""
 
     # list defaults:
     # (listting instances of primitive types such as lists as defaults in the function
@@ -94,35 +341,44 @@ def s3_fixture_factory(
         else non_existing_objects
     )
 
+    # the bucket lists do not change between tests, so they are only checked once:
+    assert set(existing_buckets_).isdisjoint(  # nosec
+        non_existing_buckets_
+    ), "The existing and non existing bucket lists may not overlap"
+
     @pytest.fixture
-    def s3_fixture() -> Generator[S3Fixture, None, None]:
-        """Pytest fixture for tests depending on the ObjectStorageS3 DAO."""
-        with LocalStackContainer(image="localstack/localstack:0.14.2").with_services(
-            "s3"
-        ) as localstack:
-            config = config_from_localstack_container(localstack)
-
-            with ObjectStorageS3(config=config) as storage:
-                populate_storage(
-                    storage=storage,
-                    bucket_fixtures=existing_buckets_,
-                    object_fixtures=existing_objects_,
-                )
-
-                assert not set(existing_buckets_) & set(  # nosec
-                    non_existing_buckets_
-                ), "The existing and non existing bucket lists may not overlap"
-
-                yield S3Fixture(
-                    config=config,
-                    storage=storage,
-                    existing_buckets=existing_buckets_,
-                    non_existing_buckets=non_existing_buckets_,
-                    existing_objects=existing_objects_,
-                    non_existing_objects=non_existing_objects_,
-                )
-
-    return s3_fixture
+    def s3_fixture(request: pytest.FixtureRequest) -> Generator[S3Fixture, None, None]:
+        """Pytest fixture for tests depending on the ObjectStorageS3 DAO.
+        The LocalStack container is shared across the test session (see
+        `_get_localstack_container`), the buckets and objects of previous tests are
+        removed before populating the storage."""
+        config = config_from_localstack_container(_get_localstack_container(request))
+        yield from _populated_s3_fixture(
+            config=config,
+            existing_buckets=existing_buckets_,
+            non_existing_buckets=non_existing_buckets_,
+            existing_objects=existing_objects_,
+            non_existing_objects=non_existing_objects_,
+        )
+
+    @pytest.fixture
+    def s3_moto_fixture() -> Generator[S3Fixture, None, None]:
+        """Pytest fixture for tests depending on the ObjectStorageS3 DAO, which uses
+        an in-process S3 mock."""
+        # moto is only needed for this fixture:
+        from moto import mock_s3  # pylint: disable=import-outside-toplevel
+
+        config = config_from_localstack_container(None)
+        with mock_s3():
+            yield from _populated_s3_fixture(
+                config=config,
+                existing_buckets=existing_buckets_,
+                non_existing_buckets=non_existing_buckets_,
+                existing_objects=existing_objects_,
+                non_existing_objects=non_existing_objects_,
+            )
+
+    return s3_moto_fixture if use_moto else s3_fixture
 
 
 # This workflow is defined as a seperate function so that it can also be used
@@ -134,21 +390,59 @@ def typical_workflow(
     bucket2_id: str = "mytestbucket2",
     object_id: str = DEFAULT_NON_EXISTING_OBJECTS[0].object_id,
     test_file_path: Path = DEFAULT_NON_EXISTING_OBJECTS[0].file_path,
-    test_file_md5: str = DEFAULT_NON_EXISTING_OBJECTS[0].md5,
+    test_file_md5: Optional[str] = None,
     use_multipart_upload: bool = True,
     part_size: int = DEFAULT_PART_SIZE,
 ):
     """
     Run a typical workflow of basic object operations using a S3 service.
+    If no md5 checksum of the test file (`test_file_md5`) is provided, it is
+    calculated from the file located at `test_file_path` in the background while
+    the first steps of the workflow are performed.
     """
     print("Run a workflow for testing basic object operations using a S3 service:")
 
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # the hash is only needed for the first upload without multipart or for
+        # the first download, so it is calculated while waiting for the network:
+        if test_file_md5 is None:
+            md5_future = executor.submit(calc_file_md5, test_file_path)
+        else:
+            md5_future = Future()
+            md5_future.set_result(test_file_md5)
+
+        _typical_workflow_steps(
+            storage_client=storage_client,
+            bucket1_id=bucket1_id,
+            bucket2_id=bucket2_id,
+            object_id=object_id,
+            test_file_path=test_file_path,
+            get_test_file_md5=md5_future.result,
+            use_multipart_upload=use_multipart_upload,
+            part_size=part_size,
+        )
+
+
+# pylint: disable=too-many-arguments
+def _typical_workflow_steps(
+    storage_client: ObjectStorageDao,
+    bucket1_id: str,
+    bucket2_id: str,
+    object_id: str,
+    test_file_path: Path,
+    get_test_file_md5: Callable[[], str],
+    use_multipart_upload: bool,
+    part_size: int,
+):
+    """The steps of the `typical_workflow`. The md5 checksum of the test file is
+    retrieved by calling `get_test_file_md5` once it is needed."""
+
+    # Steps that are implied by the success of later steps are not confirmed
+    # separately, e.g. the upload confirms the bucket creation and the download
+    # confirms the upload:
     print(f" - create new bucket {bucket1_id}")
     storage_client.create_bucket(bucket1_id)
 
-    print(" - confirm bucket creation")
-    assert storage_client.does_bucket_exist(bucket1_id)  # nosec
-
     if use_multipart_upload:
         multipart_upload_file(
             storage_dao=storage_client,
@@ -163,13 +457,12 @@ def typical_workflow(
             bucket_id=bucket1_id, object_id=object_id
         )
         upload_file(
-            presigned_url=upload_url, file_path=test_file_path, file_md5=test_file_md5
+            presigned_url=upload_url,
+            file_path=test_file_path,
+            file_md5=get_test_file_md5(),
         )
 
-    print(" - confirm object upload")
-    assert storage_client.does_object_exist(  # nosec
-        bucket_id=bucket1_id, object_id=object_id
-    )
+    test_file_md5 = get_test_file_md5()
 
     print(" - download and check object")
     download_url1 = storage_client.get_object_download_url(
@@ -189,13 +482,10 @@ def typical_workflow(
     )
     storage_client.delete_object(bucket_id=bucket1_id, object_id=object_id)
 
-    print(" - confirm move")
+    print(" - confirm deletion of the source object")
     assert not storage_client.does_object_exist(  # nosec
         bucket_id=bucket1_id, object_id=object_id
     )
-    assert storage_client.does_object_exist(  # nosec
-        bucket_id=bucket2_id, object_id=object_id
-    )
 
     print(f" - delete bucket {bucket1_id}")
     storage_client.delete_bucket(bucket1_id)
@@ -214,6 +504,91 @@ def typical_workflow(
     print("Done.")
 
 
+# pylint: disable=too-many-arguments
+async def async_typical_workflow(
+    storage_client: "AsyncObjectStorageS3",
+    bucket1_id: str = "mytestbucket1",
+    bucket2_id: str = "mytestbucket2",
+    object_id: str = DEFAULT_NON_EXISTING_OBJECTS[0].object_id,
+    test_file_path: Path = DEFAULT_NON_EXISTING_OBJECTS[0].file_path,
+    test_file_md5: Optional[str] = None,
+):
+    """
+    Run the typical workflow using the asynchronous S3 DAO. Operations that do not
+    depend on each other are run concurrently, the presigned URLs are used from
+    worker threads.
+    If no md5 checksum of the test file (`test_file_md5`) is provided, it is
+    calculated from the file located at `test_file_path`.
+    """
+    print("Run an async workflow for testing basic object operations using S3:")
+
+    if test_file_md5 is None:
+        test_file_md5 = await asyncio.to_thread(calc_file_md5, test_file_path)
+
+    # The same steps as in the synchronous `typical_workflow` are run, independent
+    # ones are overlapped:
+    print(f" - create new buckets {bucket1_id} and {bucket2_id}")
+    await storage_client.create_buckets([bucket1_id, bucket2_id])
+
+    print(f" - upload test object {object_id} to bucket")
+    upload_url = await storage_client.get_object_upload_url(
+        bucket_id=bucket1_id, object_id=object_id
+    )
+    await asyncio.to_thread(
+        upload_file,
+        presigned_url=upload_url,
+        file_path=test_file_path,
+        file_md5=test_file_md5,
+    )
+
+    print(f" - download and check object while copying it to bucket {bucket2_id}")
+    download_url1 = await storage_client.get_object_download_url(
+        bucket_id=bucket1_id, object_id=object_id
+    )
+    await asyncio.gather(
+        asyncio.to_thread(
+            download_and_check_test_file,
+            presigned_url=download_url1,
+            expected_md5=test_file_md5,
+        ),
+        storage_client.copy_object(
+            source_bucket_id=bucket1_id,
+            source_object_id=object_id,
+            dest_bucket_id=bucket2_id,
+            dest_object_id=object_id,
+        ),
+    )
+
+    print(f" - delete the object from bucket {bucket1_id}")
+    await storage_client.delete_object(bucket_id=bucket1_id, object_id=object_id)
+
+    print(" - confirm move")
+    source_exists, dest_exists = await asyncio.gather(
+        storage_client.does_object_exist(bucket_id=bucket1_id, object_id=object_id),
+        storage_client.does_object_exist(bucket_id=bucket2_id, object_id=object_id),
+    )
+    assert not source_exists  # nosec
+    assert dest_exists  # nosec
+
+    print(f" - delete bucket {bucket1_id} while downloading the moved object")
+    download_url2 = await storage_client.get_object_download_url(
+        bucket_id=bucket2_id, object_id=object_id
+    )
+    await asyncio.gather(
+        storage_client.delete_bucket(bucket1_id),
+        asyncio.to_thread(
+            download_and_check_test_file,
+            presigned_url=download_url2,
+            expected_md5=test_file_md5,
+        ),
+    )
+
+    print(" - confirm bucket deletion")
+    assert not await storage_client.does_bucket_exist(bucket1_id)  # nosec
+
+    print("Done.")
+
+
 def get_initialized_upload(s3_fixture: S3Fixture):
     """Initialize a new empty multipart upload."""
 
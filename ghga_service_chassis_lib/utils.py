@@ -18,12 +18,14 @@
 from __future__ import annotations
 
 import os
-import signal
+import time
 from abc import ABC
 from contextlib import contextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from tempfile import NamedTemporaryFile
+from threading import Thread
 from typing import Any, BinaryIO, Callable, Generator, Optional, TypeVar, cast
 
 from pydantic import BaseSettings, parse_obj_as
@@ -46,9 +48,9 @@ T = TypeVar("T")
 TEST_FILE_DIR = Path(__file__).parent.resolve() / "test_files"
 
 TEST_FILE_PATHS = [
-    TEST_FILE_DIR / filename
-    for filename in os.listdir(TEST_FILE_DIR)
-    if filename.startswith("test_") and filename.endswith(".yaml")
+    Path(entry.path)
+    for entry in os.scandir(TEST_FILE_DIR)
+    if entry.name.startswith("test_") and entry.name.endswith(".yaml")
 ]
 
 UTC = timezone.utc
@@ -107,36 +109,43 @@ class AsyncDaoGenericBase:
         ...
 
 
-def raise_timeout_error(_signalnum, _handler) -> None:
-    """Raise a TimeoutError"""
-    raise TimeoutError()
-
-
 def exec_with_timeout(
     func: Callable[..., T],
-    timeout_after: int,
+    timeout_after: float,
     func_args: Optional[list] = None,
     func_kwargs: Optional[dict] = None,
 ) -> T:
     """
     Exec a function (`func`) with a specified timeout (`timeout_after` in seconds).
     If the function doesn't finish before the timeout, a TimeoutError is thrown.
+    The function is executed in a separate daemon thread, so this can also be used
+    outside of the main thread. Please note that the function is not interrupted on
+    timeout but keeps running in the background.
     """
 
     func_args_ = [] if func_args is None else func_args
     func_kwargs_ = {} if func_kwargs is None else func_kwargs
 
-    # set a timer that raises an exception if timed out
-    signal.signal(signal.SIGALRM, raise_timeout_error)
-    signal.alarm(timeout_after)
+    outcome: dict = {}
+
+    def run_func():
+        """Execute the function and store its result or the raised exception."""
+        try:
+            outcome["result"] = func(*func_args_, **func_kwargs_)
+        except BaseException as error:  # pylint: disable=broad-except
+            outcome["error"] = error
 
-    # execute the function
-    result = func(*func_args_, **func_kwargs_)
+    thread = Thread(target=run_func, daemon=True)
+    thread.start()
+    thread.join(timeout_after)
 
-    # disable the timer
-    signal.alarm(0)
+    if thread.is_alive():
+        raise TimeoutError()
 
-    return result
+    if "error" in outcome:
+        raise outcome["error"]
+
+    return outcome["result"]
 
 
 def create_fake_drs_uri(object_id: str) -> str:
@@ -151,19 +160,39 @@ class NamedBinaryIO(ABC, BinaryIO):
 
 
 @contextmanager
-def big_temp_file(size: int) -> Generator[NamedBinaryIO, None, None]:
-    """Generates a big file with approximately the specified size in bytes."""
+def big_temp_file(
+    size: int, fill_content: bool = True
+) -> Generator[NamedBinaryIO, None, None]:
+    """Generates a big file with approximately the specified size in bytes.
+    If `fill_content` is False, the file is a sparse file of exactly `size` null
+    bytes, which neither writes to nor allocates space on the disk. This is much
+    faster for tests that only depend on the size.
+    """
+    if not fill_content:
+        with NamedTemporaryFile("w+b") as temp_file:
+            os.ftruncate(temp_file.fileno(), size)
+            temp_file.seek(size)
+            yield cast(NamedBinaryIO, temp_file)
+        return
+
     current_size = 0
     current_number = 0
     next_number = 1
+    # the content is written in chunks of roughly this size:
+    buffer_size = 1024 * 1024
+    buffer = bytearray()
     with NamedTemporaryFile("w+b") as temp_file:
         while current_size <= size:
-            byte_addition = f"{current_number}\n".encode("ASCII")
+            byte_addition = b"%d\n" % current_number
             current_size += len(byte_addition)
-            temp_file.write(byte_addition)
+            buffer += byte_addition
+            if len(buffer) >= buffer_size:
+                temp_file.write(buffer)
+                buffer.clear()
             previous_number = current_number
             current_number = next_number
             next_number = previous_number + current_number
+        temp_file.write(buffer)
         temp_file.flush()
         yield cast(NamedBinaryIO, temp_file)
 
@@ -190,12 +219,25 @@ class DateTimeUTC(datetime):
     @classmethod
     def validate(cls, value: Any) -> datetime:
         """Validate the given value."""
-        date_value = parse_obj_as(datetime, value)
-        if date_value.tzinfo is None:
-            raise ValueError(f"Date-time value is missing a timezone: {value!r}")
-        if date_value.tzinfo is not UTC:
-            date_value = date_value.astimezone(UTC)
-        return date_value
+        # strings and timestamps are hashable and often repeat, so they are cached:
+        if type(value) in (str, int):
+            return _validate_utc_datetime_cached(value)
+        return _validate_utc_datetime(value)
+
+
+def _validate_utc_datetime(value: Any) -> datetime:
+    """Parse the given value as datetime and convert it to UTC.
+    Raises a ValueError if the value has no timezone."""
+    date_value = parse_obj_as(datetime, value)
+    if date_value.tzinfo is None:
+        raise ValueError(f"Date-time value is missing a timezone: {value!r}")
+    if date_value.tzinfo is not UTC:
+        date_value = date_value.astimezone(UTC)
+    return date_value
+
+
+# datetime objects are immutable, so the results can be shared:
+_validate_utc_datetime_cached = lru_cache(maxsize=4096)(_validate_utc_datetime)
 
 
 def assert_tz_is_utc() -> None:
@@ -212,4 +254,4 @@ def now_as_utc() -> DateTimeUTC:
 
     Note: This is different from datetime.utcnow() which has no timezone.
     """
-    return DateTimeUTC.now(UTC)
+    return DateTimeUTC.fromtimestamp(time.time(), UTC)
@@ -28,7 +28,7 @@ def get_package_name() -> str:
     """Extracts the package name"""
 
     with open(SETUP_CFG_PATH, "r", encoding="utf8") as setup_cfg:
-        for line in setup_cfg.readlines():
+        for line in setup_cfg:
             line_stripped = line.strip()
             if line_stripped.startswith(NAME_PREFIX):
                 package_name = line_stripped[len(NAME_PREFIX) :]
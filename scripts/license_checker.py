@@ -22,9 +22,13 @@ exists and that they are up to date.
 """
 
 import argparse
+import os
 import re
+import string
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Tuple, Union
 
@@ -182,40 +186,64 @@ def get_target_files(
     """
     abs_target_dir = Path(target_dir).absolute()
     exclude_normalized = [(abs_target_dir / excl).absolute() for excl in exclude]
+    exclude_endings_tuple = tuple(exclude_endings)
+    # all patterns are combined into one regex that is compiled once:
+    exclude_regex = (
+        re.compile("|".join(f"(?:{pattern})" for pattern in exclude_pattern))
+        if exclude_pattern
+        else None
+    )
 
-    # get all files:
-    all_files = [
-        file_.absolute() for file_ in Path(abs_target_dir).rglob("*") if file_.is_file()
-    ]
-
-    target_files = [
-        file_
-        for file_ in all_files
-        if not (
-            any([file_.is_relative_to(excl) for excl in exclude_normalized])
-            or any([str(file_).endswith(ending) for ending in exclude_endings])
-            or any([re.match(pattern, str(file_)) for pattern in exclude_pattern])
+    # get all files, excluded directories are not traversed at all:
+    excluded_dirs = set(exclude_normalized)
+    all_files: List[Path] = []
+    for root, dir_names, file_names in os.walk(abs_target_dir):
+        root_path = Path(root)
+        dir_names[:] = [
+            dir_name
+            for dir_name in dir_names
+            if root_path / dir_name not in excluded_dirs
+        ]
+        all_files.extend(
+            root_path / file_name
+            for file_name in file_names
+            if (root_path / file_name).is_file()
         )
-    ]
-    return target_files
-
-
-def normalized_line(line: str, chars_to_trim: List[str] = COMMENT_CHARS) -> str:
-    norm_line = line.strip()
-
-    for char in chars_to_trim:
-        norm_line = norm_line.strip(char)
 
-    return norm_line.strip("\n").strip("\t").strip()
+    # a file is relative to an excluded path if it is that path or starts with it
+    # followed by a separator:
+    exclude_paths = {str(excl) for excl in exclude_normalized}
+    exclude_prefixes = tuple(str(excl) + os.sep for excl in exclude_normalized)
+
+    def is_excluded(file_path: str) -> bool:
+        """Check whether the file matches any of the exclude conditions."""
+        return (
+            file_path in exclude_paths
+            or file_path.startswith(exclude_prefixes)
+            or file_path.endswith(exclude_endings_tuple)
+            or (exclude_regex is not None and bool(exclude_regex.match(file_path)))
+        )
 
+    target_files = [file_ for file_ in all_files if not is_excluded(str(file_))]
+    return target_files
 
-def normalized_text(text: str, chars_to_trim: List[str] = COMMENT_CHARS) -> str:
-    "Normalize a license header text."
-    lines = text.split("\n")
 
+def normalized_line(line: str, chars_to_trim: List[str] = COMMENT_CHARS) -> str:
+    # strip comment chars and surrounding whitespace in a single pass:
+    return line.strip("".join(chars_to_trim) + string.whitespace)
+
+
+def normalized_text(
+    text: str,
+    chars_to_trim: List[str] = COMMENT_CHARS,
+    max_lines: Optional[int] = None,
+) -> str:
+    """Normalize a license header text.
+    If `max_lines` is specified, only the first `max_lines` non-empty lines are
+    normalized and returned."""
     norm_lines: List[str] = []
 
-    for line in lines:
+    for line in text.splitlines():
         stripped_line = line.strip()
         # exclude shebang:
         if stripped_line.startswith("#!"):
@@ -228,13 +256,17 @@ def normalized_text(text: str, chars_to_trim: List[str] = COMMENT_CHARS) -> str:
             continue
 
         norm_lines.append(norm_line)
+        if max_lines is not None and len(norm_lines) >= max_lines:
+            break
 
-    return "\n".join(norm_lines).strip("\n")
+    return "\n".join(norm_lines)
 
 
+@lru_cache(maxsize=8)
 def format_copyright_template(copyright_template: str, author: str) -> str:
     """Formats license header by inserting the specified author for every occurence of
-    "{author}" in the header template.
+    "{author}" in the header template. The result is cached as the same template is
+    formatted for every checked file.
     """
     return normalized_text(copyright_template.replace("{author}", author))
 
@@ -254,9 +286,16 @@ def is_empty_line(line: str) -> bool:
     return line.strip("\n").strip("\t").strip() == ""
 
 
-def get_header(file_path: Path, comment_chars: List[str] = COMMENT_CHARS):
-    """Extracts the header from a file and normalizes it."""
+def get_header(
+    file_path: Path,
+    comment_chars: List[str] = COMMENT_CHARS,
+    max_lines: Optional[int] = None,
+):
+    """Extracts the header from a file and normalizes it.
+    If `max_lines` is specified, reading stops once the header contains that many
+    non-empty lines (shebangs excluded) as later lines are not checked anyway."""
     header_lines: List[str] = []
+    n_content_lines = 0
 
     try:
         with open(file_path, "r") as file:
@@ -267,12 +306,19 @@ def get_header(file_path: Path, comment_chars: List[str] = COMMENT_CHARS):
                     header_lines.append(line)
                 else:
                     break
+
+                if normalized_line(line, chars_to_trim=comment_chars) and not (
+                    line.strip().startswith("#!")
+                ):
+                    n_content_lines += 1
+                    if max_lines is not None and n_content_lines >= max_lines:
+                        break
     except UnicodeDecodeError as error:
         raise UnexpectedBinaryFileError(file_path=file_path) from error
 
     # normalize the lines:
     header = "".join(header_lines)
-    return normalized_text(header, chars_to_trim=comment_chars)
+    return normalized_text(header, chars_to_trim=comment_chars, max_lines=max_lines)
 
 
 def validate_year_string(year_string: str, min_year: int = MIN_YEAR) -> bool:
@@ -309,6 +355,7 @@ def check_copyright_notice(
     author: str = AUTHOR,
     comment_chars: List[str] = COMMENT_CHARS,
     min_year: int = MIN_YEAR,
+    formatted: Optional[str] = None,
 ) -> bool:
     """Checks the specified copyright text against a template.
 
@@ -327,6 +374,9 @@ def check_copyright_notice(
         The author that shall be included in the license header.
         It will replace any appearance of "{author}" in the license
         header. This defaults to an auther info for GHGA.
+    formatted (str, optional):
+        The copyright template already formatted with the author. If provided,
+        the template is not formatted again.
 
     """
     # If the global_copyright is already set, check if the current copyright is
@@ -336,7 +386,11 @@ def check_copyright_notice(
         copyright_cleaned = "\n".join(copyright_lines[0 : global_copyright.n_lines])
         return global_copyright.text == copyright_cleaned
 
-    formatted_template = format_copyright_template(copyright_template, author=author)
+    formatted_template = (
+        format_copyright_template(copyright_template, author=author)
+        if formatted is None
+        else formatted
+    )
     template_lines = formatted_template.split("\n")
 
     # The header should be at least as long as the template:
@@ -377,6 +431,7 @@ def check_file_headers(
     exclude_pattern: List[str] = EXCLUDE_PATTERN,
     comment_chars: List[str] = COMMENT_CHARS,
     min_year: int = MIN_YEAR,
+    formatted: Optional[str] = None,
 ) -> Tuple[List[Path], List[Path]]:
     """Check files for presence of a license header and verify that
     the copyright notice is up to date (correct year).
@@ -405,6 +460,9 @@ def check_file_headers(
         exclude_pattern (List[str], optional):
             Overwrite default list of regex patterns match file path
             for exclusion.
+        formatted (str, optional):
+            The copyright template already formatted with the author. If provided,
+            the template is not formatted again.
     """
     target_files = get_target_files(
         target_dir,
@@ -413,13 +471,32 @@ def check_file_headers(
         exclude_pattern=exclude_pattern,
     )
 
+    # only the lines of the global copyright notice are compared, once known:
+    max_lines = global_copyright.n_lines if global_copyright.text else None
+
+    def read_header(target_file: Path) -> Optional[str]:
+        """Get the header of the file or None if it is a binary."""
+        try:
+            return get_header(
+                target_file, comment_chars=comment_chars, max_lines=max_lines
+            )
+        except UnexpectedBinaryFileError:
+            return None
+
     # check if license header present in file:
     passed_files: List[Path] = []
     failed_files: List[Path] = []
 
-    for target_file in target_files:
-        try:
-            header = get_header(target_file, comment_chars=comment_chars)
+    # The files are read in parallel, the headers are checked in order since the
+    # first valid header may set the global copyright notice:
+    with ThreadPoolExecutor() as executor:
+        headers = executor.map(read_header, target_files)
+
+        for target_file, header in zip(target_files, headers):
+            if header is None:
+                # This file is a binary and is therefor skipped.
+                continue
+
             if check_copyright_notice(
                 copyright=header,
                 global_copyright=global_copyright,
@@ -427,13 +504,11 @@ def check_file_headers(
                 author=author,
                 comment_chars=comment_chars,
                 min_year=min_year,
+                formatted=formatted,
             ):
                 passed_files.append(target_file)
             else:
                 failed_files.append(target_file)
-        except UnexpectedBinaryFileError:
-            # This file is a binary and is therefor skipped.
-            pass
 
     return (passed_files, failed_files)
 
@@ -445,6 +520,7 @@ def check_license_file(
     author: str = AUTHOR,
     comment_chars: List[str] = COMMENT_CHARS,
     min_year: int = MIN_YEAR,
+    formatted: Optional[str] = None,
 ) -> bool:
     """Currently only checks if the copyright notice in the
     License file is up to data.
@@ -464,18 +540,24 @@ def check_license_file(
             The author that shall be included in the copyright notice.
             It will replace any appearance of "{author}" in the copyright
             notice. This defaults to an author info for GHGA.
+        formatted (str, optional):
+            The copyright template already formatted with the author. If provided,
+            the template is not formatted again.
     """
 
     if not license_file.is_file():
         print(f'Could not find license file "{str(license_file)}".')
         return False
 
-    with open(license_file, "r") as file_:
-        license_text = normalized_text(file_.read())
+    license_text = normalized_text(license_file.read_text())
 
     # Extract the copyright notice:
     # (is expected to be at the end of the file):
-    formatted_template = format_copyright_template(copyright_template, author=author)
+    formatted_template = (
+        format_copyright_template(copyright_template, author=author)
+        if formatted is None
+        else formatted
+    )
     template_lines = formatted_template.split("\n")
     license_lines = license_text.split("\n")
     copyright = "\n".join(license_lines[-len(template_lines) :])
@@ -487,6 +569,7 @@ def check_license_file(
         author=author,
         comment_chars=comment_chars,
         min_year=min_year,
+        formatted=formatted_template,
     )
 
 
@@ -522,8 +605,10 @@ def run():
     global_copyright = GlobalCopyrightNotice()
 
     # get global copyright from .devcontainer/license_header.txt file:
-    with open(GLOBAL_COPYRIGHT_FILE_PATH, "r") as global_copyright_file:
-        global_copyright.text = normalized_text(global_copyright_file.read())
+    global_copyright.text = normalized_text(GLOBAL_COPYRIGHT_FILE_PATH.read_text())
+
+    # the formatted template is shared by the license file and the header checks:
+    formatted = format_copyright_template(COPYRIGHT_TEMPLATE, author=AUTHOR)
 
     if args.no_license_file_check:
         license_file_valid = True
@@ -531,7 +616,7 @@ def run():
         license_file = Path(target_dir / LICENSE_FILE)
         print(f'Checking if LICENSE file is up to date: "{license_file}"')
         license_file_valid = check_license_file(
-            license_file, global_copyright=global_copyright
+            license_file, global_copyright=global_copyright, formatted=formatted
         )
         print(
             "Copyright notice in license file is "
@@ -541,12 +626,15 @@ def run():
 
     print("Checking license headers in files:")
     passed_files, failed_files = check_file_headers(
-        target_dir, global_copyright=global_copyright
+        target_dir, global_copyright=global_copyright, formatted=formatted
     )
     print(f"{len(passed_files)} files passed.")
     print(f"{len(failed_files)} files failed" + (":" if failed_files else "."))
-    for failed_file in failed_files:
-        print(f'  - "{failed_file.relative_to(target_dir)}"')
+    # all target files are located below the target dir:
+    prefix_len = len(str(target_dir)) + 1
+    sys.stdout.write(
+        "".join(f'  - "{str(file_)[prefix_len:]}"\n' for file_ in failed_files)
+    )
 
     print("")
 
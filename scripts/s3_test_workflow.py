@@ -22,13 +22,27 @@ Help on using this script:
 `./s3_workflow_check.py --help`
 """
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 import typer
 
-from ghga_service_chassis_lib.object_storage_dao import ObjectStorageDao
+from ghga_service_chassis_lib.object_storage_dao import (
+    BucketNotFoundError,
+    ObjectNotFoundError,
+    ObjectStorageDao,
+)
 from ghga_service_chassis_lib.s3 import ObjectStorageS3, S3ConfigBase
-from ghga_service_chassis_lib.s3_testing import typical_workflow
+from ghga_service_chassis_lib.s3_testing import (
+    async_typical_workflow,
+    typical_workflow,
+)
+
+# The credentials are always passed explicitly, so botocore must not spend time on
+# querying the EC2 instance metadata service when run outside of AWS:
+os.environ.setdefault("AWS_EC2_METADATA_DISABLED", "true")
 
 
 def cleanup_buckets_and_objects(
@@ -40,11 +54,39 @@ def cleanup_buckets_and_objects(
 
     print("Cleanup buckets and objects.")
 
-    for bucket_id in bucket_ids:
-        if storage_client.does_object_exist(bucket_id=bucket_id, object_id=object_id):
+    def cleanup_bucket(bucket_id: str):
+        """Cleanup the object and the bucket with the given ID."""
+        # deletions are attempted directly instead of probing for existence first:
+        try:
             storage_client.delete_object(bucket_id=bucket_id, object_id=object_id)
-        if storage_client.does_bucket_exist(bucket_id):
+        except (BucketNotFoundError, ObjectNotFoundError):
+            pass
+        try:
             storage_client.delete_bucket(bucket_id)
+        except BucketNotFoundError:
+            pass
+
+    # the buckets are independent of each other and can be cleaned up in parallel:
+    with ThreadPoolExecutor(max_workers=min(32, len(bucket_ids) * 2 or 1)) as executor:
+        # consume the results to re-raise exceptions:
+        list(executor.map(cleanup_bucket, bucket_ids))
+
+
+async def run_async_workflow(
+    config: S3ConfigBase, bucket1_id: str, bucket2_id: str, object_id: str
+):
+    """Run the workflow using the asynchronous S3 DAO (requires aioboto3)."""
+
+    # pylint: disable=import-outside-toplevel
+    from ghga_service_chassis_lib.s3_async import AsyncObjectStorageS3
+
+    async with AsyncObjectStorageS3(config) as storage:
+        await async_typical_workflow(
+            storage_client=storage,
+            bucket1_id=bucket1_id,
+            bucket2_id=bucket2_id,
+            object_id=object_id,
+        )
 
 
 def test_workflow(  # pylint: disable=too-many-arguments
@@ -54,6 +96,7 @@ def test_workflow(  # pylint: disable=too-many-arguments
     bucket1_id: str = "mytestbucket1",
     bucket2_id: str = "mytestbucket2",
     object_id: str = "mytestfile",
+    use_async: bool = False,
 ):
     """Run a workflow for testing basic object operations using a S3 service."""
 
@@ -69,12 +112,22 @@ def test_workflow(  # pylint: disable=too-many-arguments
             bucket_ids=[bucket1_id, bucket2_id],
             object_id=object_id,
         )
-        typical_workflow(
-            storage_client=storage,
-            bucket1_id=bucket1_id,
-            bucket2_id=bucket2_id,
-            object_id=object_id,
-        )
+        if use_async:
+            asyncio.run(
+                run_async_workflow(
+                    config=config,
+                    bucket1_id=bucket1_id,
+                    bucket2_id=bucket2_id,
+                    object_id=object_id,
+                )
+            )
+        else:
+            typical_workflow(
+                storage_client=storage,
+                bucket1_id=bucket1_id,
+                bucket2_id=bucket2_id,
+                object_id=object_id,
+            )
         cleanup_buckets_and_objects(
             storage_client=storage,
             bucket_ids=[bucket1_id, bucket2_id],
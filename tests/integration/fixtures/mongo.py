@@ -0,0 +1,39 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Fixtures for testing the mongo_connect module"""
+
+from typing import Generator
+from uuid import uuid4
+
+import pytest
+from testcontainers.mongodb import MongoDbContainer
+
+# a pinned image so that test runs are reproducible and a cached image can be used:
+MONGODB_IMAGE = "mongo:6.0.5"
+
+
+@pytest.fixture(scope="session")
+def mongodb_container_fixture() -> Generator[MongoDbContainer, None, None]:
+    """Pytest fixture that runs a single MongoDB container for the entire test
+    session. Tests should use a database of their own (see `get_db_name`)."""
+    with MongoDbContainer(MONGODB_IMAGE) as mongo:
+        yield mongo
+
+
+def get_db_name() -> str:
+    """Get a unique database name so that tests sharing the MongoDB container do
+    not interfere with each other."""
+    return f"test_{uuid4().hex}"
@@ -17,11 +17,14 @@
 
 
 from collections import namedtuple
+from typing import Generator
 
-from sqlalchemy import Column, Integer, String, create_engine
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, insert
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm.decl_api import DeclarativeMeta
+from testcontainers.postgres import PostgresContainer
 
 Base: DeclarativeMeta = declarative_base()
 
@@ -57,17 +60,29 @@ def fixture_to_orm_model(entry: DummyFixtureModel) -> DummyModel:
     return DummyModel(some_string=entry.some_string, some_number=entry.some_number)
 
 
+@pytest.fixture(scope="session")
+def postgres_container_fixture() -> Generator[PostgresContainer, None, None]:
+    """Pytest fixture that runs a single PostgreSQL container for the entire test
+    session. Use `populate_db` to reset the database for a test."""
+    with PostgresContainer() as postgres:
+        yield postgres
+
+
 def populate_db(db_url: str):
     """Create and populates the DB"""
 
-    # setup database and tables:
+    # setup database and tables, tables of previous tests are removed since the
+    # database container is shared across the test session:
     engine = create_engine(db_url)
+    Base.metadata.drop_all(engine)
     Base.metadata.create_all(engine)
 
-    # populate with test data:
+    # populate with test data by executing one INSERT statement for all rows
+    # (executemany):
     session_factor = sessionmaker(engine)
     with session_factor() as session:
-        for entry in PREPOPULATED_TEST_DATA:
-            orm_entry = fixture_to_orm_model(entry)
-            session.add(orm_entry)
+        session.execute(
+            insert(DummyModel),
+            [entry._asdict() for entry in PREPOPULATED_TEST_DATA],
+        )
         session.commit()
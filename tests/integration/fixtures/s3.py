@@ -18,3 +18,4 @@
 from ghga_service_chassis_lib.s3_testing import s3_fixture_factory
 
 s3_fixture = s3_fixture_factory()
+s3_moto_fixture = s3_fixture_factory(use_moto=True)
@@ -16,6 +16,7 @@
 """Utils for Fixture handling"""
 
 import socket
+import time
 from contextlib import closing
 from pathlib import Path
 
@@ -25,6 +26,21 @@ BASE_DIR = Path(__file__).parent.resolve()
 def find_free_port():
     """Find a free port."""
     with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as sock:
-        sock.bind(("", 0))
+        # the option only has an effect if set before binding:
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(("", 0))
         return sock.getsockname()[1]
+
+
+def wait_for_port(host: str, port: int, timeout: float = 10.0):
+    """Wait until a server accepts connections on the specified port. Raises a
+    TimeoutError if this does not happen within the `timeout` (in seconds)."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return
+        except OSError as error:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Port {port} on {host} did not open.") from error
+            time.sleep(0.05)
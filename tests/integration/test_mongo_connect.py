@@ -21,27 +21,35 @@ from testcontainers.mongodb import MongoDbContainer
 
 from ghga_service_chassis_lib.mongo_connect import DBConnect
 
+from .fixtures.mongo import get_db_name, mongodb_container_fixture  # noqa: F401
+
 
 @pytest.mark.asyncio
-async def test_get_collection():
+async def test_get_collection(
+    mongodb_container_fixture: MongoDbContainer,  # noqa: F811
+):
     """
     Test, if we can establish a connection and insert data to the database
     """
 
-    with MongoDbContainer("mongo:latest") as mongo:
-        db_connect = DBConnect(mongo.get_connection_url(), mongo.MONGO_DB)
-        collection = await db_connect.get_collection("test_collection")
-        await collection.insert_one({"id": "key", "value": 0})
-        key_value = await collection.count_documents({})
-        assert key_value == 1
+    db_connect = DBConnect(
+        mongodb_container_fixture.get_connection_url(), get_db_name()
+    )
+    collection = await db_connect.get_collection("test_collection")
+    await collection.insert_one({"id": "key", "value": 0})
+    key_value = await collection.count_documents({})
+    assert key_value == 1
 
 
 @pytest.mark.asyncio
-async def test_close_db():
+async def test_close_db(
+    mongodb_container_fixture: MongoDbContainer,  # noqa: F811
+):
     """
     Test, if close_db actually closes the connection
     """
 
-    with MongoDbContainer("mongo:latest") as mongo:
-        db_connect = DBConnect(mongo.get_connection_url(), mongo.MONGO_DB)
-        await db_connect.close_db()
+    db_connect = DBConnect(
+        mongodb_container_fixture.get_connection_url(), get_db_name()
+    )
+    await db_connect.close_db()
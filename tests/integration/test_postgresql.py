@@ -33,92 +33,97 @@ from .fixtures.postgresql import (
     DummyModel,
     fixture_to_orm_model,
     populate_db,
+    postgres_container_fixture,
 )
 
 
-def test_sync_connector_query():
+def test_sync_connector_query(
+    postgres_container_fixture: PostgresContainer,  # noqa: F811
+):
     """Tests the SyncPostgresqlConnector"""
 
-    with PostgresContainer() as postgres:
-        config = config_from_psql_container(postgres)
-        populate_db(config.db_url)
+    config = config_from_psql_container(postgres_container_fixture)
+    populate_db(config.db_url)
 
-        psql_connector = SyncPostgresqlConnector(config)
+    psql_connector = SyncPostgresqlConnector(config)
 
-        # query existing entries:
-        with psql_connector.transactional_session() as session:
-            query = session.execute(select(DummyModel).order_by(DummyModel.some_number))
-            first_entry = query.scalars().first()
-            expected_first_entry = PREPOPULATED_TEST_DATA[0]
-        assert first_entry.some_string == expected_first_entry.some_string
+    # query existing entries:
+    with psql_connector.transactional_session() as session:
+        query = session.execute(select(DummyModel).order_by(DummyModel.some_number))
+        first_entry = query.scalars().first()
+        expected_first_entry = PREPOPULATED_TEST_DATA[0]
+    assert first_entry.some_string == expected_first_entry.some_string
 
 
-def test_sync_connector_commit():
+def test_sync_connector_commit(
+    postgres_container_fixture: PostgresContainer,  # noqa: F811
+):
     """Tests the SyncPostgresqlConnector"""
 
-    with PostgresContainer() as postgres:
-        entry = ADDITIONAL_TEST_DATA[0]
+    entry = ADDITIONAL_TEST_DATA[0]
 
-        config = config_from_psql_container(postgres)
-        populate_db(config.db_url)
+    config = config_from_psql_container(postgres_container_fixture)
+    populate_db(config.db_url)
 
-        psql_connector = SyncPostgresqlConnector(config)
+    psql_connector = SyncPostgresqlConnector(config)
 
-        # commit additional entry:
-        with psql_connector.transactional_session() as session:
-            orm_entry = fixture_to_orm_model(entry)
-            session.add(orm_entry)
+    # commit additional entry:
+    with psql_connector.transactional_session() as session:
+        orm_entry = fixture_to_orm_model(entry)
+        session.add(orm_entry)
 
-        # query for the newly added entry:
-        with psql_connector.transactional_session() as session:
-            query = session.execute(
-                select(DummyModel).where(DummyModel.some_string == entry.some_string)
-            )
-            first_entry = query.scalars().first()
-        assert first_entry.some_string == entry.some_string
+    # query for the newly added entry:
+    with psql_connector.transactional_session() as session:
+        query = session.execute(
+            select(DummyModel).where(DummyModel.some_string == entry.some_string)
+        )
+        first_entry = query.scalars().first()
+    assert first_entry.some_string == entry.some_string
 
 
 @pytest.mark.asyncio
-async def test_async_connector_query():
+async def test_async_connector_query(
+    postgres_container_fixture: PostgresContainer,  # noqa: F811
+):
     """Tests the AsyncPostgresqlConnector"""
 
-    with PostgresContainer() as postgres:
-        config = config_from_psql_container(postgres)
-        populate_db(config.db_url)
+    config = config_from_psql_container(postgres_container_fixture)
+    populate_db(config.db_url)
 
-        psql_connector = AsyncPostgresqlConnector(config)
+    psql_connector = AsyncPostgresqlConnector(config)
 
-        # query existing entries:
-        async with psql_connector.transactional_session() as session:
-            query = await session.execute(
-                select(DummyModel).order_by(DummyModel.some_number)
-            )
-            first_entry = query.scalars().first()
-            expected_first_entry = PREPOPULATED_TEST_DATA[0]
-        assert first_entry.some_string == expected_first_entry.some_string
+    # query existing entries:
+    async with psql_connector.transactional_session() as session:
+        query = await session.execute(
+            select(DummyModel).order_by(DummyModel.some_number)
+        )
+        first_entry = query.scalars().first()
+        expected_first_entry = PREPOPULATED_TEST_DATA[0]
+    assert first_entry.some_string == expected_first_entry.some_string
 
 
 @pytest.mark.asyncio
-async def test_async_connector_commit():
+async def test_async_connector_commit(
+    postgres_container_fixture: PostgresContainer,  # noqa: F811
+):
     """Tests the AsyncPostgresqlConnector"""
 
-    with PostgresContainer() as postgres:
-        entry = ADDITIONAL_TEST_DATA[0]
+    entry = ADDITIONAL_TEST_DATA[0]
 
-        config = config_from_psql_container(postgres)
-        populate_db(config.db_url)
+    config = config_from_psql_container(postgres_container_fixture)
+    populate_db(config.db_url)
 
-        psql_connector = AsyncPostgresqlConnector(config)
+    psql_connector = AsyncPostgresqlConnector(config)
 
-        # commit additional entry:
-        async with psql_connector.transactional_session() as session:
-            orm_entry = fixture_to_orm_model(entry)
-            session.add(orm_entry)
+    # commit additional entry:
+    async with psql_connector.transactional_session() as session:
+        orm_entry = fixture_to_orm_model(entry)
+        session.add(orm_entry)
 
-        # query for the newly added entry:
-        async with psql_connector.transactional_session() as session:
-            query = await session.execute(
-                select(DummyModel).where(DummyModel.some_string == entry.some_string)
-            )
-            first_entry = query.scalars().first()
-        assert first_entry.some_string == entry.some_string
+    # query for the newly added entry:
+    async with psql_connector.transactional_session() as session:
+        query = await session.execute(
+            select(DummyModel).where(DummyModel.some_string == entry.some_string)
+        )
+        first_entry = query.scalars().first()
+    assert first_entry.some_string == entry.some_string
@@ -22,8 +22,9 @@ You may also adapt the RabbitMQ host by defining the
 
 from copy import deepcopy
 
+import pytest
+
 from ghga_service_chassis_lib.pubsub import AmqpTopic
-from ghga_service_chassis_lib.utils import exec_with_timeout
 
 from .fixtures.pubsub import amqp_fixture  # noqa: F401
 from .fixtures.pubsub import EXAMPLE_MESSAGE, EXAMPLE_MESSAGE_SCHEMA, EXAMPLE_TOPIC_NAME
@@ -65,9 +66,21 @@ def test_subscribing(amqp_fixture):  # noqa: F811
         topic_name=EXAMPLE_TOPIC_NAME,
         json_schema=EXAMPLE_MESSAGE_SCHEMA,
     )
-    exec_with_timeout(
-        func=lambda: topic.subscribe(
-            exec_on_message=process_message, run_forever=False
-        ),
-        timeout_after=2,
-    )
+    topic.subscribe(exec_on_message=process_message, run_forever=False, timeout_after=2)
+
+
+def test_subscribing_timeout(amqp_fixture):  # noqa: F811
+    """Test that a subscription without any incoming message stops at the timeout and
+    does not consume messages published afterwards."""
+    topic = AmqpTopic(config=amqp_fixture.config, topic_name="timeout_test_topic")
+
+    with pytest.raises(TimeoutError):
+        topic.subscribe(
+            exec_on_message=lambda message: None, run_forever=False, timeout_after=0.5
+        )
+
+    # a message published after the timeout is left for the next subscription:
+    topic.publish(EXAMPLE_MESSAGE)
+    received: list = []
+    topic.subscribe(exec_on_message=received.append, run_forever=False, timeout_after=2)
+    assert len(received) == 1
@@ -17,13 +17,13 @@
 Test S3 storage DAO
 """
 
+from pathlib import Path
 from typing import Optional
 
 import pytest
 from black import nullcontext
 
 from ghga_service_chassis_lib.object_storage_dao import (
-    DEFAULT_PART_SIZE,
     BucketAlreadyExists,
     BucketNotFoundError,
     MultiPartUploadAlreadyExistsError,
@@ -35,7 +35,6 @@ from ghga_service_chassis_lib.object_storage_dao import (
 )
 from ghga_service_chassis_lib.object_storage_dao_testing import (
     MEBIBYTE,
-    ObjectFixture,
     upload_part,
     upload_part_of_size,
 )
@@ -47,7 +46,7 @@ from ghga_service_chassis_lib.s3_testing import (
 )
 from ghga_service_chassis_lib.utils import big_temp_file
 
-from .fixtures.s3 import s3_fixture  # noqa: F401
+from .fixtures.s3 import s3_fixture, s3_moto_fixture  # noqa: F401
 
 
 @pytest.mark.parametrize("use_multipart_upload", [True, False])
@@ -58,27 +57,50 @@ def test_typical_workflow(
     Tests all methods of the ObjectStorageS3 DAO implementation in one long workflow.
     """
     with (
-        big_temp_file(size=20 * MEBIBYTE) if use_multipart_upload else nullcontext()
+        # only the size of the big file matters, its content does not:
+        big_temp_file(size=20 * MEBIBYTE, fill_content=False)
+        if use_multipart_upload
+        else nullcontext()
     ) as temp_file:
-        object_fixture = (
-            s3_fixture.non_existing_objects[0]
-            if temp_file is None
-            else ObjectFixture(
-                file_path=temp_file.name, bucket_id="", object_id="some-big-file"
-            )
-        )
+        if temp_file is None:
+            object_fixture = s3_fixture.non_existing_objects[0]
+            object_id = object_fixture.object_id
+            test_file_path = object_fixture.file_path
+            test_file_md5: Optional[str] = object_fixture.md5
+        else:
+            # the md5 of the big file is calculated by the workflow while uploading:
+            object_id = "some-big-file"
+            test_file_path = Path(temp_file.name)
+            test_file_md5 = None
 
         typical_workflow(
             storage_client=s3_fixture.storage,
             bucket1_id=s3_fixture.non_existing_buckets[0],
             bucket2_id=s3_fixture.non_existing_buckets[1],
-            object_id=object_fixture.object_id,
-            test_file_md5=object_fixture.md5,
-            test_file_path=object_fixture.file_path,
+            object_id=object_id,
+            test_file_md5=test_file_md5,
+            test_file_path=test_file_path,
             use_multipart_upload=use_multipart_upload,
         )
 
 
+def test_typical_workflow_moto(s3_moto_fixture: S3Fixture):  # noqa: F811
+    """
+    Tests the ObjectStorageS3 DAO implementation against the in-process S3 mock.
+    """
+    object_fixture = s3_moto_fixture.non_existing_objects[0]
+
+    typical_workflow(
+        storage_client=s3_moto_fixture.storage,
+        bucket1_id=s3_moto_fixture.non_existing_buckets[0],
+        bucket2_id=s3_moto_fixture.non_existing_buckets[1],
+        object_id=object_fixture.object_id,
+        test_file_md5=object_fixture.md5,
+        test_file_path=object_fixture.file_path,
+        use_multipart_upload=False,
+    )
+
+
 def test_object_and_bucket_collisions(s3_fixture: S3Fixture):  # noqa: F811
     """
     Tests whether overwriting (re-creation, re-upload, or copy to exisitng object) fails with the expected error.
@@ -102,6 +124,52 @@ def test_object_and_bucket_collisions(s3_fixture: S3Fixture):  # noqa: F811
         )
 
 
+def test_do_objects_exist(s3_fixture: S3Fixture):  # noqa: F811
+    """Tests checking the existence of multiple objects at once."""
+    existing_object = s3_fixture.existing_objects[0]
+    non_existing_object = s3_fixture.non_existing_objects[0]
+
+    assert s3_fixture.storage.do_objects_exist(
+        bucket_id=existing_object.bucket_id,
+        object_ids=[existing_object.object_id, non_existing_object.object_id],
+    ) == {existing_object.object_id: True, non_existing_object.object_id: False}
+
+    assert s3_fixture.storage.do_objects_exist(
+        bucket_id=s3_fixture.non_existing_buckets[0],
+        object_ids=[existing_object.object_id],
+    ) == {existing_object.object_id: False}
+
+
+def test_presigned_url_caching(s3_fixture: S3Fixture):  # noqa: F811
+    """
+    Tests that presigned URLs for the same object are reused but that modifying the
+    returned fields does not affect subsequent calls.
+    """
+    existing_object = s3_fixture.existing_objects[0]
+    non_existing_object = s3_fixture.non_existing_objects[0]
+
+    download_urls = [
+        s3_fixture.storage.get_object_download_url(
+            bucket_id=existing_object.bucket_id, object_id=existing_object.object_id
+        )
+        for _ in range(2)
+    ]
+    assert download_urls[0] == download_urls[1]
+
+    first_upload_url = s3_fixture.storage.get_object_upload_url(
+        bucket_id=existing_object.bucket_id,
+        object_id=non_existing_object.object_id,
+    )
+    expected_fields = dict(first_upload_url.fields)
+    first_upload_url.fields.clear()
+
+    second_upload_url = s3_fixture.storage.get_object_upload_url(
+        bucket_id=existing_object.bucket_id,
+        object_id=non_existing_object.object_id,
+    )
+    assert second_upload_url.fields == expected_fields
+
+
 def test_handling_non_existing_file_and_bucket(s3_fixture: S3Fixture):  # noqa: F811
     """
     Tests whether the re-creaction of an existing bucket fails with the expected error.
@@ -229,52 +297,43 @@ def test_invalid_part_number(
 
 
 @pytest.mark.parametrize(
-    "part_sizes, anticipated_part_size, anticipated_part_quantity, exception",
+    "part_sizes, checks",
     [
-        ([10 * MEBIBYTE, 10 * MEBIBYTE, 1 * MEBIBYTE], None, None, None),
-        ([10 * MEBIBYTE, 10 * MEBIBYTE, 1 * MEBIBYTE], 10 * MEBIBYTE, 3, None),
-        ([], None, None, MultiPartUploadConfirmError),  # zero parts uploaded
+        ([10 * MEBIBYTE, 10 * MEBIBYTE, 1 * MEBIBYTE], [(None, None, None)]),
+        ([10 * MEBIBYTE, 10 * MEBIBYTE, 1 * MEBIBYTE], [(10 * MEBIBYTE, 3, None)]),
+        ([], [(None, None, MultiPartUploadConfirmError)]),  # zero parts uploaded
         (
             [10 * MEBIBYTE, 10 * MEBIBYTE, 11 * MEBIBYTE],
-            None,
-            2,
-            MultiPartUploadConfirmError,
-        ),  # Missmatch with anticipated parts
-        (
-            [10 * MEBIBYTE, 5 * MEBIBYTE, 1 * MEBIBYTE],
-            None,
-            None,
-            MultiPartUploadConfirmError,
-        ),  # heterogenous part sizes
-        (
-            [10 * MEBIBYTE, 10 * MEBIBYTE, 11 * MEBIBYTE],
-            None,
-            None,
-            MultiPartUploadConfirmError,
-        ),  # last part bigger than first part
+            [
+                # Missmatch with anticipated parts:
+                (None, 2, MultiPartUploadConfirmError),
+                # last part bigger than first part:
+                (None, None, MultiPartUploadConfirmError),
+                # Too large last part:
+                (10 * MEBIBYTE, None, MultiPartUploadConfirmError),
+            ],
+        ),
         (
             [10 * MEBIBYTE, 5 * MEBIBYTE, 1 * MEBIBYTE],
-            10 * MEBIBYTE,
-            None,
-            MultiPartUploadConfirmError,
-        ),  # missmatch anticipated part size
-        (
-            [10 * MEBIBYTE, 10 * MEBIBYTE, 11 * MEBIBYTE],
-            10 * MEBIBYTE,
-            None,
-            MultiPartUploadConfirmError,
-        ),  # Too large last part
+            [
+                # heterogenous part sizes:
+                (None, None, MultiPartUploadConfirmError),
+                # missmatch anticipated part size:
+                (10 * MEBIBYTE, None, MultiPartUploadConfirmError),
+            ],
+        ),
     ],
 )
 def test_complete_multipart_upload(
     part_sizes: list[int],
-    anticipated_part_size: Optional[int],
-    anticipated_part_quantity: Optional[int],
-    exception: Optional[Exception],
+    checks: list[tuple[Optional[int], Optional[int], Optional[Exception]]],
     s3_fixture: S3Fixture,  # noqa: F811
 ):
     """
     Test the complete_multipart_upload method.
+    The parts are only uploaded once for all `checks` that expect the same
+    `part_sizes`. A rejected completion leaves the upload unchanged, so checks that
+    expect an exception have to precede the one that completes the upload.
     """
     upload_id, bucket_id, object_id = get_initialized_upload(s3_fixture)
     for part_idx, part_size in enumerate(part_sizes):
@@ -287,14 +346,15 @@ def test_complete_multipart_upload(
             part_number=part_idx + 1,
         )
 
-    with pytest.raises(exception) if exception else nullcontext():  # type: ignore
-        s3_fixture.storage.complete_multipart_upload(
-            upload_id=upload_id,
-            bucket_id=bucket_id,
-            object_id=object_id,
-            anticipated_part_quantity=anticipated_part_quantity,
-            anticipated_part_size=anticipated_part_size,
-        )
+    for anticipated_part_size, anticipated_part_quantity, exception in checks:
+        with pytest.raises(exception) if exception else nullcontext():  # type: ignore
+            s3_fixture.storage.complete_multipart_upload(
+                upload_id=upload_id,
+                bucket_id=bucket_id,
+                object_id=object_id,
+                anticipated_part_quantity=anticipated_part_quantity,
+                anticipated_part_size=anticipated_part_size,
+            )
 
 
 @pytest.mark.parametrize("empty_upload", (True, False))
@@ -308,12 +368,14 @@ def test_abort_multipart_upload(
 
     upload_id, bucket_id, object_id = get_initialized_upload(s3_fixture)
 
+    # the size of the parts is only validated when completing the upload, thus,
+    # tiny parts are sufficient to test the abortion:
     upload_part = lambda part_number: upload_part_of_size(
         storage_dao=s3_fixture.storage,
         upload_id=upload_id,
         bucket_id=bucket_id,
         object_id=object_id,
-        size=DEFAULT_PART_SIZE,
+        size=1,
         part_number=part_number,
     )
 
@@ -0,0 +1,118 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test the asynchronous S3 storage DAO
+"""
+
+import pytest
+
+from ghga_service_chassis_lib.object_storage_dao import (
+    BucketNotFoundError,
+    ObjectNotFoundError,
+)
+from ghga_service_chassis_lib.object_storage_dao_testing import (
+    download_and_check_test_file,
+    upload_file,
+)
+from ghga_service_chassis_lib.s3_async import AsyncObjectStorageS3
+from ghga_service_chassis_lib.s3_testing import S3Fixture, async_typical_workflow
+
+from .fixtures.s3 import s3_fixture  # noqa: F401
+
+
+@pytest.mark.asyncio
+async def test_typical_workflow(s3_fixture: S3Fixture):  # noqa: F811
+    """
+    Tests the main methods of the AsyncObjectStorageS3 DAO implementation in one
+    workflow.
+    """
+    test_object = s3_fixture.non_existing_objects[0]
+    bucket_id = s3_fixture.non_existing_buckets[0]
+    copy_bucket_id = s3_fixture.non_existing_buckets[1]
+
+    async with AsyncObjectStorageS3(config=s3_fixture.config) as storage:
+        await storage.create_buckets([bucket_id, copy_bucket_id])
+        assert await storage.does_bucket_exist(bucket_id)
+
+        upload_url = await storage.get_object_upload_url(
+            bucket_id=bucket_id, object_id=test_object.object_id
+        )
+        upload_file(
+            presigned_url=upload_url,
+            file_path=test_object.file_path,
+            file_md5=test_object.md5,
+        )
+        assert await storage.does_object_exist(
+            bucket_id=bucket_id, object_id=test_object.object_id
+        )
+
+        await storage.copy_object(
+            source_bucket_id=bucket_id,
+            source_object_id=test_object.object_id,
+            dest_bucket_id=copy_bucket_id,
+            dest_object_id=test_object.object_id,
+        )
+
+        download_url = await storage.get_object_download_url(
+            bucket_id=copy_bucket_id, object_id=test_object.object_id
+        )
+        download_and_check_test_file(
+            presigned_url=download_url, expected_md5=test_object.md5
+        )
+
+        await storage.delete_objects(
+            bucket_id=bucket_id, object_ids=[test_object.object_id]
+        )
+        assert not await storage.does_object_exist(
+            bucket_id=bucket_id, object_id=test_object.object_id
+        )
+
+        await storage.delete_bucket(bucket_id)
+        await storage.delete_bucket(copy_bucket_id, delete_content=True)
+        assert not await storage.does_bucket_exist(copy_bucket_id)
+
+
+@pytest.mark.asyncio
+async def test_async_typical_workflow(s3_fixture: S3Fixture):  # noqa: F811
+    """Tests the concurrent workflow helper of the `s3_testing` module."""
+    test_object = s3_fixture.non_existing_objects[0]
+
+    async with AsyncObjectStorageS3(config=s3_fixture.config) as storage:
+        await async_typical_workflow(
+            storage_client=storage,
+            bucket1_id=s3_fixture.non_existing_buckets[0],
+            bucket2_id=s3_fixture.non_existing_buckets[1],
+            object_id=test_object.object_id,
+            test_file_path=test_object.file_path,
+            test_file_md5=test_object.md5,
+        )
+
+
+@pytest.mark.asyncio
+async def test_not_found_errors(s3_fixture: S3Fixture):  # noqa: F811
+    """Test that operations on non-existing resources raise the expected errors."""
+    existing_bucket_id = s3_fixture.existing_buckets[0]
+    non_existing_bucket_id = s3_fixture.non_existing_buckets[0]
+    non_existing_object_id = s3_fixture.non_existing_objects[0].object_id
+
+    async with AsyncObjectStorageS3(config=s3_fixture.config) as storage:
+        with pytest.raises(BucketNotFoundError):
+            await storage.delete_bucket(non_existing_bucket_id)
+
+        with pytest.raises(ObjectNotFoundError):
+            await storage.get_object_download_url(
+                bucket_id=existing_bucket_id, object_id=non_existing_object_id
+            )
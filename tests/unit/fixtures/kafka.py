@@ -0,0 +1,29 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Fixtures for testing the `akafka` module"""
+
+from typing import Generator
+
+import pytest
+from testcontainers.kafka import KafkaContainer
+
+
+@pytest.fixture(scope="session")
+def kafka_container_fixture() -> Generator[KafkaContainer, None, None]:
+    """Pytest fixture that runs a single Kafka container for the entire test session
+    since starting Kafka takes considerable time."""
+    with KafkaContainer() as kafka:
+        yield kafka
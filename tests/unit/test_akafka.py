@@ -28,6 +28,8 @@ from ghga_service_chassis_lib.akafka import (
 )
 from ghga_service_chassis_lib.utils import exec_with_timeout
 
+from .fixtures.kafka import kafka_container_fixture  # noqa: F401
+
 
 class EventSuccessfullyConsumed(RuntimeError):
     """Raised when expected payload is received."""
@@ -41,7 +43,7 @@ def exec_dummy_func(received_payload: dict, expected_payload: dict):
     raise EventSuccessfullyConsumed()
 
 
-def test_pub_sub():
+def test_pub_sub(kafka_container_fixture: KafkaContainer):  # noqa: F811
     """Testing the Publisher and Subscriber classes."""
     topic_name = "test_topic"
     event_type = "test_event"
@@ -69,32 +71,32 @@ def test_pub_sub():
         )
     }
 
-    with KafkaContainer() as kafka:
-        sub_config = KafkaConfigBase(
-            service_name="test_sub",
-            client_suffix="1",
-            kafka_servers=[kafka.get_bootstrap_server()],
-        )
-        pub_config = KafkaConfigBase(
-            service_name="test_pub",
-            client_suffix="1",
-            kafka_servers=[kafka.get_bootstrap_server()],
+    kafka_servers = [kafka_container_fixture.get_bootstrap_server()]
+    sub_config = KafkaConfigBase(
+        service_name="test_sub",
+        client_suffix="1",
+        kafka_servers=kafka_servers,
+    )
+    pub_config = KafkaConfigBase(
+        service_name="test_pub",
+        client_suffix="1",
+        kafka_servers=kafka_servers,
+    )
+
+    with EventProducer(
+        config=pub_config, topic_name=topic_name, event_schemas=event_schemas
+    ) as producer:
+        producer.publish(
+            event_type=event_type, event_key=event_key, event_payload=event_payload
         )
 
-        with EventProducer(
-            config=pub_config, topic_name=topic_name, event_schemas=event_schemas
-        ) as producer:
-            producer.publish(
-                event_type=event_type, event_key=event_key, event_payload=event_payload
+    with EventConsumer(
+        config=sub_config,
+        topic_names=[topic_name],
+        exec_funcs=exec_funcs,
+        event_schemas=event_schemas,
+    ) as consumer:
+        with pytest.raises(EventSuccessfullyConsumed):
+            exec_with_timeout(
+                lambda: consumer.subscribe(run_forever=False), timeout_after=20000
             )
-
-        with EventConsumer(
-            config=sub_config,
-            topic_names=[topic_name],
-            exec_funcs=exec_funcs,
-            event_schemas=event_schemas,
-        ) as consumer:
-            with pytest.raises(EventSuccessfullyConsumed):
-                exec_with_timeout(
-                    lambda: consumer.subscribe(run_forever=False), timeout_after=20000
-                )
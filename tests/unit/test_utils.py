@@ -15,13 +15,14 @@
 
 """Test the utils module."""
 
+import os
 from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 
 from pydantic import BaseModel
 from pytest import mark, raises
 
-from ghga_service_chassis_lib.utils import UTC, DateTimeUTC, now_as_utc
+from ghga_service_chassis_lib.utils import UTC, DateTimeUTC, big_temp_file, now_as_utc
 
 
 @mark.parametrize(
@@ -120,3 +121,15 @@ def test_now_as_utc():
     assert now_as_utc().tzinfo is UTC
     assert now_as_utc().utcoffset() == timedelta(0)
     assert abs(now_as_utc().timestamp() - datetime.now().timestamp()) < 5
+
+
+@mark.parametrize("fill_content", [True, False])
+def test_big_temp_file(fill_content: bool):
+    """Test that big_temp_file creates a file of approximately the requested size."""
+    size = 1024 * 1024
+    with big_temp_file(size=size, fill_content=fill_content) as temp_file:
+        file_size = os.path.getsize(temp_file.name)
+
+    assert size <= file_size < 2 * size
+    if not fill_content:
+        assert file_size == size